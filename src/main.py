@@ -3,22 +3,66 @@ import os
 import json
 import subprocess
 import platform
+import select
+import signal
 import threading
 import time
-import configparser
+import contextlib
+import functools
+import atexit
+import logging
+import logging.handlers
+import queue
+import re
+import shutil
+import tempfile
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson  # Optional: faster parsing of large container/object listings
+except ImportError:
+    orjson = None
+# The OS can't change while we run, so resolve it once
+_PLATFORM = platform.system()
+_IS_WINDOWS = _PLATFORM == "Windows"
+_IS_LINUX = _PLATFORM == "Linux"
+# Likewise the home directory (expanduser consults the environment/pwd each call)
+_USER_HOME = os.path.expanduser("~")
+# The app's own state (tokens, logs, bookkeeping); rclone's config dir is rclone's
+_APP_CONFIG_DIR = os.path.join(_USER_HOME, ".config", "haio-client")
+
+# Logo assets ship next to this file
+_LOGO_SVG_PATH = os.path.join(os.path.dirname(__file__), "haio-logo.svg")
+_LOGO_PNG_PATH = os.path.join(os.path.dirname(__file__), "haio-logo.png")
+
+if _IS_WINDOWS:
+    import msvcrt
+else:
+    import fcntl
+from typing import Dict, List, Optional, Set
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QPushButton, QLineEdit, QLabel, QMessageBox,
     QTextEdit, QProgressBar, QGroupBox, QFrame, QCheckBox,
-    QScrollArea, QStackedWidget, QSplitter, QTabWidget,
+    QScrollArea, QSplitter, QTabWidget,
     QTableWidget, QTableWidgetItem, QHeaderView, QSpacerItem,
     QSizePolicy, QDialog, QDialogButtonBox, QFormLayout, QStatusBar,
-    QListWidget, QListWidgetItem, QInputDialog
+    QListWidget, QListWidgetItem, QInputDialog, QMenu
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect, QSize, QMetaObject, Q_ARG, QSettings, QUrl
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QPainter, QLinearGradient, QBrush, QAction, QPainterPath
+from PyQt6.QtCore import Qt, QCoreApplication, QThread, pyqtSignal, pyqtSlot, QTimer, QPropertyAnimation, QEasingCurve, QRect, QSize, QMetaObject, Q_ARG, QSettings, QUrl
+from PyQt6.QtGui import QFont, QGuiApplication, QIcon, QPalette, QColor, QPixmap, QPainter, QLinearGradient, QBrush, QAction, QPainterPath, QPixmapCache
+
+# Mount/unmount paths log through a queue so console I/O happens on the
+# listener thread instead of the worker doing the mount
+log = logging.getLogger("haio")
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Import TempURL and sharing components
 try:
@@ -31,6 +75,552 @@ except ImportError as e:
     TEMPURL_AVAILABLE = False
 
 
+# Stylesheet templates are rendered against ThemeManager colors via _themed_qss().
+_LOGIN_QSS = """
+QDialog {{
+    background-color: transparent;
+}}
+
+QFrame#mainFrame {{
+    background-color: {c[bg]};
+    border-radius: 15px;
+    border: 1px solid {c[border]};
+}}
+
+QLabel#title {{
+    font-size: 22px;
+    font-weight: bold;
+    color: {c[text]};
+    margin-bottom: 5px;
+    padding: 5px 0px;
+}}
+
+QLabel#subtitle {{
+    font-size: 13px;
+    color: {c[text_secondary]};
+    padding: 2px 0px;
+}}
+
+QLabel#fieldLabel {{
+    color: {c[text]};
+    font-weight: bold;
+    font-size: 13px;
+    margin-bottom: 3px;
+    padding: 3px 2px;
+    background-color: transparent;
+    min-height: 20px;
+    max-height: 20px;
+}}
+
+QLineEdit#input {{
+    border: 2px solid {c[input_border]};
+    border-radius: 8px;
+    padding: 10px 12px;
+    font-size: 14px;
+    background-color: {c[input_bg]};
+    color: {c[text]};
+    margin: 1px 0px;
+    min-height: 20px;
+    max-height: 40px;
+}}
+
+QLineEdit#input:focus {{
+    border-color: {c[primary]};
+    background-color: {c[bg_widget]};
+    outline: none;
+}}
+
+QCheckBox#checkbox {{
+    color: {c[text]};
+    font-size: 13px;
+    margin-top: 3px;
+    padding: 5px 0px;
+    spacing: 8px;
+    min-height: 25px;
+    max-height: 25px;
+}}
+
+QCheckBox#checkbox::indicator {{
+    width: 16px;
+    height: 16px;
+    border: 2px solid {c[input_border]};
+    border-radius: 4px;
+    background-color: {c[bg_widget]};
+    margin-right: 8px;
+}}
+
+QCheckBox#checkbox::indicator:checked {{
+    background-color: {c[primary]};
+    border-color: {c[primary]};
+    image: url(none);
+}}
+
+QLabel#errorLabel {{
+    color: #e74c3c;
+    background-color: {c[error_bg]};
+    border: 1px solid {c[error_border]};
+    border-radius: 6px;
+    padding: 8px;
+    margin: 5px 0px;
+    font-size: 12px;
+}}
+
+QPushButton#loginButton {{
+    background-color: {c[primary]};
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 14px;
+    font-weight: bold;
+    min-width: 100px;
+    min-height: 42px;
+    max-height: 42px;
+}}
+
+QPushButton#loginButton:hover {{
+    background-color: {c[primary_hover]};
+}}
+
+QPushButton#loginButton:pressed {{
+    background-color: #1c5a85;
+}}
+
+QPushButton#cancelButton {{
+    background-color: transparent;
+    color: {c[text_secondary]};
+    border: 2px solid {c[border]};
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 14px;
+    min-width: 100px;
+    min-height: 42px;
+    max-height: 42px;
+}}
+
+QPushButton#cancelButton:hover {{
+    border-color: {c[text_secondary]};
+    color: {c[text]};
+    background-color: {c[bg_alt]};
+}}
+
+QPushButton#cancelButton:pressed {{
+    background-color: {c[bg_widget]};
+}}
+
+QLabel#registerText {{
+    color: {c[text_secondary]};
+    font-size: 13px;
+}}
+
+QLabel#registerLink {{
+    font-size: 13px;
+}}
+
+QLabel#registerLink a {{
+    color: {c[primary]};
+    text-decoration: none;
+    font-weight: bold;
+}}
+
+QLabel#registerLink a:hover {{
+    text-decoration: underline;
+}}
+"""
+
+_MAIN_QSS = """
+QMainWindow {{
+    background-color: {c[bg_alt]};
+}}
+
+QFrame#header {{
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 {c[primary]}, stop:1 {c[primary_hover]});
+    border-bottom: 3px solid {c[primary_hover]};
+}}
+
+QFrame#logoContainer {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(52, 152, 219, 0.3), stop:1 rgba(41, 128, 185, 0.3));
+    border-radius: 35px;
+    border: 3px solid rgba(255, 255, 255, 0.2);
+}}
+
+QLabel#appTitle {{
+    color: white;
+    font-size: 22px;
+    font-weight: bold;
+    letter-spacing: 0.5px;
+}}
+
+QLabel#userLabel {{
+    color: rgba(255, 255, 255, 0.85);
+    font-size: 13px;
+    font-weight: 500;
+}}
+
+QPushButton#headerButton {{
+    background-color: rgba(255, 255, 255, 0.15);
+    color: white;
+    border: 2px solid rgba(255, 255, 255, 0.3);
+    border-radius: 10px;
+    padding: 12px 20px;
+    font-weight: 600;
+    font-size: 14px;
+    margin: 0 2px;
+    min-width: 100px;
+}}
+
+QPushButton#headerButton:hover {{
+    background-color: rgba(255, 255, 255, 0.3);
+    border-color: rgba(255, 255, 255, 0.6);
+}}
+
+QPushButton#headerButton:pressed {{
+    background-color: rgba(255, 255, 255, 0.1);
+}}
+
+QPushButton#logoutButton {{
+    background-color: rgba(231, 76, 60, 0.8);
+    color: white;
+    border: 2px solid rgba(255, 255, 255, 0.3);
+    border-radius: 10px;
+    padding: 12px 20px;
+    font-weight: 600;
+    font-size: 14px;
+    margin: 0 2px;
+    min-width: 100px;
+}}
+
+QPushButton#logoutButton:hover {{
+    background-color: rgba(192, 57, 43, 0.9);
+    border-color: rgba(255, 255, 255, 0.6);
+}}
+
+QPushButton#logoutButton:pressed {{
+    background-color: rgba(192, 57, 43, 0.7);
+}}
+
+QPushButton#consoleButton {{
+    background-color: rgba(52, 152, 219, 0.8);
+    color: white;
+    border: 2px solid rgba(255, 255, 255, 0.3);
+    border-radius: 10px;
+    padding: 12px 20px;
+    font-weight: 600;
+    font-size: 14px;
+    margin: 0 2px;
+    min-width: 110px;
+}}
+
+QPushButton#consoleButton:hover {{
+    background-color: rgba(41, 128, 185, 0.9);
+    border-color: rgba(255, 255, 255, 0.6);
+}}
+
+QPushButton#consoleButton:pressed {{
+    background-color: rgba(41, 128, 185, 0.7);
+}}
+
+QPushButton#iconButton {{
+    background-color: rgba(52, 152, 219, 0.1);
+    color: {c[text]};
+    border: none;
+    border-radius: 8px;
+    font-size: 20px;
+    font-weight: 500;
+    padding: 0px;
+}}
+
+QPushButton#iconButton:hover {{
+    background-color: rgba(52, 152, 219, 0.2);
+    color: #3498db;
+}}
+
+QPushButton#iconButton:pressed {{
+    background-color: rgba(52, 152, 219, 0.3);
+}}
+
+QLabel#loadingLabel {{
+    font-size: 16px;
+    color: {c[text]};
+}}
+
+QLabel#pageTitle {{
+    font-size: 26px;
+    font-weight: bold;
+    color: {c[text]};
+    margin-bottom: 5px;
+}}
+
+QLabel#pageSubtitle {{
+    font-size: 14px;
+    color: {c[text_secondary]};
+    margin-bottom: 10px;
+}}
+
+QScrollArea#bucketsScrollArea {{
+    border: none;
+    background-color: transparent;
+}}
+
+QScrollArea#bucketsScrollArea QScrollBar:vertical {{
+    background-color: {c[bg_widget]};
+    width: 12px;
+    border-radius: 6px;
+    margin: 2px;
+}}
+
+QScrollArea#bucketsScrollArea QScrollBar::handle:vertical {{
+    background-color: {c[border]};
+    border-radius: 5px;
+    min-height: 30px;
+}}
+
+QScrollArea#bucketsScrollArea QScrollBar::handle:vertical:hover {{
+    background-color: {c[text_secondary]};
+}}
+
+QScrollArea#bucketsScrollArea QScrollBar::add-line:vertical,
+QScrollArea#bucketsScrollArea QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+
+QProgressBar {{
+    border: 2px solid {c[border]};
+    border-radius: 8px;
+    text-align: center;
+    background-color: {c[bg_widget]};
+    color: {c[text]};
+}}
+
+QProgressBar::chunk {{
+    background-color: {c[primary]};
+    border-radius: 6px;
+}}
+"""
+
+_BUCKET_FRAME_QSS = """
+BucketWidget {{
+    border: 2px solid {c[border]};
+    border-radius: 12px;
+    background-color: {c[bg_widget]};
+    margin: 5px;
+}}
+BucketWidget:hover {{
+    border-color: {c[primary]};
+    background-color: {c[bg_alt]};
+}}
+"""
+
+_AUTO_MOUNT_CB_QSS = """
+QCheckBox {{
+    color: {c[text]};
+    font-size: 13px;
+    font-weight: 500;
+    spacing: 8px;
+}}
+QCheckBox::indicator {{
+    width: 18px;
+    height: 18px;
+    border: 2px solid {c[border]};
+    border-radius: 4px;
+    background-color: {c[bg_widget]};
+}}
+QCheckBox::indicator:hover {{
+    border-color: {c[primary]};
+}}
+QCheckBox::indicator:checked {{
+    background-color: {c[primary]};
+    border-color: {c[primary]};
+    image: none;
+}}
+"""
+
+# Static stylesheets below are used as-is (not rendered through _themed_qss).
+_MOUNT_BTN_QSS = """
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #45a049;
+}
+QPushButton:pressed {
+    background-color: #3d8b40;
+}
+"""
+
+_UNMOUNT_BTN_QSS = """
+QPushButton {
+    background-color: #e74c3c;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #c0392b;
+}
+"""
+
+_STATUS_MOUNTED_QSS = "color: #27ae60; font-weight: bold;"
+_STATUS_UNMOUNTED_QSS = "color: #e74c3c; font-weight: bold;"
+
+_AI_CHAT_BTN_QSS = """
+QPushButton {
+    background-color: #9b59b6;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-weight: bold;
+    margin-left: 5px;
+    font-size: 13px;
+}
+QPushButton:hover {
+    background-color: #8e44ad;
+}
+QPushButton:pressed {
+    background-color: #7d3c98;
+}
+"""
+
+_BROWSE_SHARE_BTN_QSS = """
+QPushButton {
+    background-color: #e67e22;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-weight: bold;
+    margin-left: 5px;
+    font-size: 13px;
+}
+QPushButton:hover {
+    background-color: #d35400;
+}
+QPushButton:pressed {
+    background-color: #ba4a00;
+}
+"""
+
+_ERROR_LABEL_QSS = """
+QLabel#errorLabel {
+    color: #e74c3c;
+    background-color: #fdf2f2;
+    border: 1px solid #f5c6cb;
+    border-radius: 6px;
+    padding: 8px;
+    margin: 5px 0px;
+    font-size: 12px;
+}
+"""
+
+# Static help text for busy-unmount failures; only the error is filled in
+_UNMOUNT_BUSY_DETAILS = """Error details: {error}
+
+Common solutions:
+• Close any file managers or file explorers showing this location
+• Close any applications that have files open from this location  
+• Close any terminal windows with current directory in this location
+• Wait a moment and try again
+
+The system will automatically retry unmounting when files are no longer in use."""
+
+# Auto-mount status texts, kept in one place for wording rather than speed
+# (str.format is no cheaper than an f-string); "{}" takes the bucket name(s)
+_MSG_AUTO_ON_START = "Enabling auto-mount for {}..."
+_MSG_AUTO_ON_OK = "✓ Auto-mount enabled for {}"
+_MSG_AUTO_ON_FAIL = "✗ Failed to enable auto-mount for {}"
+_MSG_AUTO_OFF_START = "Disabling auto-mount for {}..."
+_MSG_AUTO_OFF_OK = "✓ Auto-mount disabled for {}"
+_MSG_AUTO_OFF_FAIL = "✗ Failed to disable auto-mount for {}"
+_MSG_AUTO_ON_FAIL_DETAIL = ("Failed to enable auto-mount for {}.\n"
+                            f"Make sure you have admin privileges on {'Windows' if _IS_WINDOWS else 'Linux'}.")
+
+_QSS_CACHE: Dict[tuple, str] = {}
+
+
+def _themed_qss(template: str, colors: Dict[str, str]) -> str:
+    """Render a stylesheet template for a color scheme, reusing earlier renders."""
+    key = (template, tuple(sorted(colors.items())))
+    qss = _QSS_CACHE.get(key)
+    if qss is None:
+        qss = _minify_qss(template.format(c=colors))
+        _QSS_CACHE[key] = qss
+    return qss
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and layout whitespace so Qt's stylesheet parser has less to tokenize."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r'\s*([{};])\s*', r'\1', qss).strip()
+
+
+def _home_mount_prefix(username: str) -> str:
+    """Path prefix of a user's default mount points; append the bucket name."""
+    return os.path.join(_USER_HOME, f"haio-{username}-")
+
+
+@functools.lru_cache(maxsize=None)
+def _logo_pixmap(size: int) -> Optional[QPixmap]:
+    """Load and scale the Haio logo once (SVG preferred, then PNG); None if neither loads."""
+    for path in (_LOGO_SVG_PATH, _LOGO_PNG_PATH):
+        if os.path.exists(path):
+            pixmap = QPixmap(path)
+            if not pixmap.isNull():
+                return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                     Qt.TransformationMode.SmoothTransformation)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _app_icon() -> QIcon:
+    """Window/taskbar icon: the PNG logo if shipped, else a painted "H" badge. Built once."""
+    if os.path.exists(_LOGO_PNG_PATH):
+        return QIcon(_LOGO_PNG_PATH)
+    
+    # Painted once at a large size; QIcon downsamples it for every requested size
+    size = 256
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    # Circular Haio-green gradient background
+    gradient = QLinearGradient(0, 0, size, size)
+    gradient.setColorAt(0, QColor("#4CAF50"))
+    gradient.setColorAt(1, QColor("#45a049"))
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(8, 8, size - 16, size - 16)
+    
+    # White "H"
+    painter.setPen(QColor("white"))
+    font = QFont("Arial")
+    font.setPixelSize(size // 2)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "H")
+    
+    painter.end()
+    return QIcon(pixmap)
+
+
+@functools.lru_cache(maxsize=None)
+def _bucket_name_font() -> QFont:
+    """Bold font for bucket names, shared by every BucketWidget."""
+    return QFont("Arial", 14, QFont.Weight.Bold)
+
+
 class ThemeManager:
     """Manages application theme and detects system dark mode."""
     
@@ -39,7 +629,7 @@ class ThemeManager:
         self.is_dark = self.detect_dark_mode()
         
         # Set up theme change monitoring
-        if self.app and platform.system() == "Linux":
+        if self.app and _IS_LINUX:
             # Monitor palette changes for Linux
             self.app.paletteChanged.connect(self.on_theme_changed)
     
@@ -57,7 +647,7 @@ class ThemeManager:
     
     def detect_dark_mode(self) -> bool:
         """Detect if system is in dark mode."""
-        system = platform.system()
+        system = _PLATFORM
         
         if system == "Windows":
             return self._detect_windows_dark_mode()
@@ -203,9 +793,18 @@ class PasswordDialog(QDialog):
         return self.password_input.text()
 
 
+def _json_body(resp) -> List[Dict]:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 class ApiClient:
     """Simplified API client for authentication and bucket operations."""
     
+    CONTAINERS_CACHE_TTL = 5  # seconds
+    
     def __init__(self, base_url: str = "https://drive.haio.ir"):
         self.base_url = base_url.rstrip('/')
         self.auth_url = f"{base_url}/auth/v1.0"
@@ -214,6 +813,22 @@ class ApiClient:
         self.storage_url = None
         self.account = None
         self.username = None
+        
+        # One pooled session so listing and later calls reuse the same TLS connection.
+        # Auth runs on the GUI thread during auto-login, so it goes through the
+        # default single-attempt adapter; retries are mounted on the storage URL
+        # once authentication returns it.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._storage_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                            max_retries=Retry(total=3, backoff_factor=0.3,
+                                                              status_forcelist=[502, 503, 504]))
+        self.session.headers.update({'User-Agent': 'haio-smartapp'})
+        
+        # Last container listing as (cache key, etag, last_modified, data, fetched_at)
+        self._containers_cache = None
     
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate user and get token."""
@@ -223,7 +838,7 @@ class ApiClient:
                 'X-Storage-Pass': password,
             }
             
-            resp = requests.get(self.auth_url, headers=headers, timeout=10)
+            resp = self.session.get(self.auth_url, headers=headers, timeout=10)
             
             if resp.status_code not in (200, 204):
                 return False
@@ -233,23 +848,55 @@ class ApiClient:
             self.account = username
             self.username = username
             
+            if self.token is not None and self.storage_url:
+                self.session.mount(self.storage_url, self._storage_adapter)
+                # Best-effort and retried, so keep it off the caller's thread
+                threading.Thread(target=self._warm_storage_connection, daemon=True).start()
+            
             return self.token is not None
             
         except Exception as e:
             print(f"Authentication error: {e}")
             return False
     
+    def _warm_storage_connection(self):
+        """Open the pooled connection to the storage host before the first listing."""
+        try:
+            self.session.head(self.storage_url, headers={'X-Auth-Token': self.token}, timeout=5)
+        except requests.RequestException as e:
+            print(f"Could not pre-connect to storage host: {e}")
+    
     def list_containers(self) -> List[Dict]:
         """List user's containers (buckets)."""
         if not self.token or not self.storage_url:
             return []
         
+        # Only reuse a listing fetched for this same account and token
+        key = (self.storage_url, self.token)
+        cache = self._containers_cache
+        if cache and cache[0] != key:
+            cache = None
+        if cache and time.monotonic() - cache[4] < self.CONTAINERS_CACHE_TTL:
+            return cache[3]
+        
         try:
             headers = {'X-Auth-Token': self.token}
-            resp = requests.get(f"{self.storage_url}?format=json", headers=headers, timeout=10)
-            
+            if cache:
+                # Revalidate so an unchanged listing comes back as an empty 304
+                if cache[1]:
+                    headers['If-None-Match'] = cache[1]
+                if cache[2]:
+                    headers['If-Modified-Since'] = cache[2]
+            resp = self.session.get(f"{self.storage_url}?format=json", headers=headers, timeout=10)
+            
+            if resp.status_code == 304 and cache:
+                self._containers_cache = cache[:4] + (time.monotonic(),)
+                return cache[3]
             if resp.status_code == 200:
-                return resp.json()
+                data = _json_body(resp)
+                self._containers_cache = (key, resp.headers.get('ETag'),
+                                          resp.headers.get('Last-Modified'), data, time.monotonic())
+                return data
             return []
             
         except Exception as e:
@@ -266,7 +913,7 @@ class ApiClient:
                 'X-Auth-Token': self.token,
                 'X-Account-Meta-Temp-URL-Key': key
             }
-            resp = requests.post(self.storage_url, headers=headers, timeout=10)
+            resp = self.session.post(self.storage_url, headers=headers, timeout=10)
             return resp.status_code == 204
         except Exception as e:
             print(f"Error setting temp URL key: {e}")
@@ -280,43 +927,132 @@ class ApiClient:
         try:
             headers = {'X-Auth-Token': self.token}
             url = f"{self.storage_url}/{container}?format=json"
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = self.session.get(url, headers=headers, timeout=10)
             
             if resp.status_code == 200:
-                return resp.json()
+                return _json_body(resp)
             return []
             
         except Exception as e:
             print(f"Error listing objects: {e}")
             return []
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
 
 
 class RcloneManager:
     """Manages rclone configuration and mounting operations."""
     
+    # VFS cache tuning shared by the Windows/Linux mount commands and the systemd unit.
+    # Swift has no change notifications, so --dir-cache-time bounds how stale listings get.
+    VFS_MOUNT_FLAGS = (
+        '--dir-cache-time', '1m',
+        '--poll-interval', '1m',
+        '--vfs-cache-mode', 'full',
+        '--vfs-cache-max-age', '24h',
+        '--vfs-write-back', '10s',
+        '--vfs-read-wait', '20ms',
+        '--buffer-size', '32M',
+        '--attr-timeout', '1m',
+    )
+    # Flags newer than the distro rclone builds we may fall back to (Ubuntu 22.04
+    # ships 1.53), added only when the binary reports at least that version
+    VFS_VERSIONED_FLAGS = (
+        ((1, 54), ('--vfs-read-ahead', '128M')),
+        ((1, 64), ('--vfs-refresh',)),
+    )
+    
+    # (executable path, mtime) -> (probe time, issue or None) from the last `rclone --version`
+    _version_cache: Dict[tuple, tuple] = {}
+    # (executable path, mtime) -> (major, minor), or None if the version couldn't be read
+    _version_numbers: Dict[tuple, Optional[tuple]] = {}
+    VERSION_CACHE_TTL = 60  # seconds
+    WINFSP_CACHE_TTL = 30  # seconds
+    SERVICE_STATE_TTL = 5  # seconds
+    # Shared mountinfo snapshot for bulk widget refreshes. Anything that changes
+    # the mount table from this process calls invalidate_mount_snapshot(), so
+    # the TTL only bounds how long a mount made elsewhere goes unnoticed.
+    MOUNT_SNAPSHOT_TTL = 0.5  # seconds
+    ELEVATED_TASK_TIMEOUT = 120  # seconds to wait for a UAC-elevated schtasks batch
+    
     def __init__(self):
-        self.home_dir = os.path.expanduser("~")
+        self.home_dir = _USER_HOME
         
         # Platform-specific paths
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             self.config_dir = os.path.join(self.home_dir, "AppData", "Roaming", "rclone")
             self.cache_dir = os.path.join(self.home_dir, "AppData", "Local", "rclone", "cache")
             self.service_dir = None  # No systemd on Windows
+            self.user_service_dir = None
             self.rclone_executable = self._find_rclone_executable()
         else:  # Linux/Unix
             self.config_dir = os.path.join(self.home_dir, ".config", "rclone")
             self.cache_dir = os.path.join(self.home_dir, ".cache", "rclone")
-            self.service_dir = "/etc/systemd/system"
+            self.service_dir = "/etc/systemd/system"  # Legacy system-wide units
+            self.user_service_dir = os.path.join(self.home_dir, ".config", "systemd", "user")
             self.rclone_executable = self._find_rclone_executable()
         self.config_path = os.path.join(self.config_dir, "rclone.conf")
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.cache_dir, exist_ok=True)
+        for directory in (self.config_dir, self.cache_dir):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
         # Optional: rclone log file path; when set, mount commands will include --log-file
         self.rclone_log_file: Optional[str] = None
+        # Cached WinFsp probe result as (expires_at, installed)
+        self._winfsp_check: Optional[tuple] = None
+        # Cached haio-* systemd unit states per scope: {user_scope: (fetched_at, {unit: state})}
+        self._service_states: Dict[bool, tuple] = {}
+        # Auto-mount enablement per (username, bucket), kept current by create/remove
+        self._auto_mount_cache: Dict[tuple, bool] = {}
+        # Cached scheduled task names as (fetched_at, {name}); Windows only
+        self._task_names: Optional[tuple] = None
+        # Escaped mount points from /proc/self/mountinfo as (read_at, {path})
+        self._mount_snapshot: Optional[tuple] = None
+        # Long-lived PowerShell process shared by the Windows probes (started on first use)
+        self._ps_session: Optional[subprocess.Popen] = None
+        self._ps_lines: Optional[queue.Queue] = None
+        self._ps_lock = threading.Lock()
+        self._ps_seq = 0
+        # Set once systemd lingering is known to be on for this user
+        self._linger_enabled = False
+        # Outcome of this run's unprivileged loginctl attempt: None (not tried yet),
+        # 'needs_sudo', or 'error' (loginctl missing or not answering)
+        self._linger_probe: Optional[str] = None
+        # Remembers across runs that lingering is on, or that the user declined the sudo prompt
+        self._linger_state_path = os.path.join(_APP_CONFIG_DIR, "linger")
+        # Platform auto-mount backend, picked once
+        if _IS_LINUX:
+            self._auto_ops = {
+                'create': self.create_systemd_service,
+                'create_many': self.create_systemd_services,
+                'remove': self.remove_systemd_service,
+                'enabled': self.is_systemd_service_enabled,
+            }
+        elif _IS_WINDOWS:
+            self._auto_ops = {
+                'create': self.create_windows_startup_task,
+                'create_many': self.create_windows_startup_tasks,
+                'remove': self.remove_windows_startup_task,
+                'enabled': self.is_windows_startup_task_enabled,
+            }
+        else:
+            self._auto_ops = {
+                'create': self._auto_mount_unsupported,
+                'create_many': lambda username, specs, parent_widget=None: {name: False for name, _ in specs},
+                'remove': lambda username, bucket_name, parent_widget=None: True,
+                'enabled': lambda username, bucket_name: False,
+            }
     
     def _find_rclone_executable(self):
         """Find rclone executable with priority to bundled version."""
-        if platform.system() == "Windows":
+        return self._locate_rclone(self.home_dir)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _locate_rclone(home_dir: str) -> str:
+        """Search the candidate rclone locations once per process."""
+        if _IS_WINDOWS:
             # Check for bundled rclone first (in same directory as executable)
             possible_paths = [
                 os.path.join(os.path.dirname(sys.executable), "rclone.exe"),  # Bundled with app
@@ -324,7 +1060,7 @@ class RcloneManager:
                 "rclone.exe",  # If in PATH
                 "C:\\Program Files\\rclone\\rclone.exe",
                 "C:\\Program Files (x86)\\rclone\\rclone.exe",
-                os.path.join(self.home_dir, "rclone", "rclone.exe"),
+                os.path.join(home_dir, "rclone", "rclone.exe"),
             ]
         else:  # Linux/Unix
             possible_paths = [
@@ -333,35 +1069,34 @@ class RcloneManager:
                 "rclone",  # If in PATH
                 "/usr/local/bin/rclone",
                 "/usr/bin/rclone",
-                os.path.join(self.home_dir, ".local/bin/rclone"),
+                os.path.join(home_dir, ".local/bin/rclone"),
             ]
         
         for path in possible_paths:
             if os.path.isfile(path):
-                if platform.system() != "Windows":
+                if not _IS_WINDOWS:
                     # Make sure it's executable on Unix systems
                     try:
-                        os.chmod(path, 0o755)
+                        if not os.stat(path).st_mode & 0o111:
+                            os.chmod(path, 0o755)
                     except:
                         pass
                 return path
-            elif path.endswith(("rclone.exe", "rclone")) and self._check_path_executable(path):
+            elif path.endswith(("rclone.exe", "rclone")) and RcloneManager._check_path_executable(path):
                 return path
         
         # Fallback
-        return "rclone.exe" if platform.system() == "Windows" else "rclone"
+        return "rclone.exe" if _IS_WINDOWS else "rclone"
     
-    def _check_path_executable(self, executable):
+    @staticmethod
+    def _check_path_executable(executable):
         """Check if executable is available in PATH."""
-        try:
-            subprocess.run([executable, "--version"], capture_output=True, timeout=5)
-            return True
-        except:
-            return False
+        return shutil.which(executable) is not None
     
-    def _run_hidden_subprocess(self, cmd, **kwargs):
-        """Run subprocess command without showing console window on Windows."""
-        if platform.system() == "Windows":
+    @staticmethod
+    def _hide_console(kwargs: Dict) -> Dict:
+        """Add the Windows flags that keep a child process from opening a console window."""
+        if _IS_WINDOWS:
             # Create startupinfo to hide console window
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -372,33 +1107,93 @@ class RcloneManager:
             creation_flags |= 0x08000000  # CREATE_NO_WINDOW
             kwargs['creationflags'] = creation_flags
             kwargs['startupinfo'] = startupinfo
+        return kwargs
+    
+    def _run_hidden_subprocess(self, cmd, **kwargs):
+        """Run subprocess command without showing console window on Windows."""
+        return subprocess.run(cmd, **self._hide_console(kwargs))
+    
+    def _ps_run(self, script: str, timeout: float = 10) -> str:
+        """Run a one-line PowerShell script in the shared session and return its output.
         
-        return subprocess.run(cmd, **kwargs)
+        Starting powershell.exe costs a few hundred ms, so one process is kept
+        alive and fed commands on stdin; each command is followed by a sentinel
+        line that marks the end of its output.
+        """
+        with self._ps_lock:
+            if self._ps_session is None or self._ps_session.poll() is not None:
+                self._start_ps_session()
+            
+            self._ps_seq += 1
+            sentinel = f"__haio_ps_done_{self._ps_seq}__"
+            self._ps_session.stdin.write(f"{script}\nWrite-Output '{sentinel}'\n")
+            self._ps_session.stdin.flush()
+            
+            output = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._ps_lines.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # The session is in an unknown state; start a fresh one next time
+                    self._close_ps_session()
+                    raise subprocess.TimeoutExpired(script, timeout)
+                if line is None:
+                    self._close_ps_session()
+                    raise OSError("PowerShell session exited")
+                if line.rstrip('\r\n') == sentinel:
+                    return "".join(output)
+                output.append(line)
+    
+    def _start_ps_session(self):
+        """Start the shared PowerShell process and a thread draining its output."""
+        self._close_ps_session()
+        proc = subprocess.Popen(
+            ['powershell', '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-'],
+            **self._hide_console(dict(stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True, bufsize=1)))
+        lines = queue.Queue()
+        
+        def pump():
+            for line in proc.stdout:
+                lines.put(line)
+            lines.put(None)  # EOF
+        
+        threading.Thread(target=pump, daemon=True).start()
+        self._ps_session = proc
+        self._ps_lines = lines
+    
+    def _close_ps_session(self):
+        """Stop the shared PowerShell process, if running."""
+        proc, self._ps_session = self._ps_session, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
     
     def check_dependencies(self):
         """Check if required dependencies are available."""
-        issues = []
+        # The rclone probe and the FUSE/WinFsp probe are independent subprocess/disk
+        # checks, so run them side by side
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            rclone_future = pool.submit(self._probe_rclone_version)
+            driver_future = pool.submit(self._check_mount_driver)
+            rclone_issue = rclone_future.result()
+            issues = [rclone_issue] if rclone_issue else []
+            issues.extend(driver_future.result())
         
-        # Check rclone
-        try:
-            result = subprocess.run([self.rclone_executable, "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode != 0:
-                issues.append(f"rclone is not working properly")
-        except FileNotFoundError:
-            issues.append("rclone is not installed or not found in PATH")
-        except subprocess.TimeoutExpired:
-            issues.append("rclone is not responding")
-        except Exception as e:
-            issues.append(f"Error checking rclone: {e}")
+        return issues
+    
+    def _check_mount_driver(self) -> List[str]:
+        """Check the FUSE (Linux) or WinFsp (Windows) prerequisite."""
+        issues = []
         
         # Check FUSE on Linux
-        if platform.system() == "Linux":
+        if _IS_LINUX:
             if not os.path.exists("/usr/bin/fusermount") and not os.path.exists("/bin/fusermount"):
                 issues.append("FUSE is not installed (install with: sudo apt-get install fuse)")
         
         # Check WinFsp on Windows with better detection
-        elif platform.system() == "Windows":
+        elif _IS_WINDOWS:
             winfsp_installed = self._check_winfsp_installation()
             if not winfsp_installed:
                 # Check if we have bundled WinFsp installer
@@ -410,11 +1205,101 @@ class RcloneManager:
         
         return issues
     
+    def _probe_rclone_version(self) -> Optional[str]:
+        """Run `rclone --version`, reusing a recent result for the same binary."""
+        resolved = shutil.which(self.rclone_executable) or self.rclone_executable
+        try:
+            mtime = os.path.getmtime(resolved)
+        except OSError:
+            return "rclone is not installed or not found in PATH"
+        
+        key = (resolved, mtime)
+        cached = RcloneManager._version_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.VERSION_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            result = self._run_hidden_subprocess([self.rclone_executable, "--version"], 
+                                  capture_output=True, text=True, timeout=10)
+            issue = None if result.returncode == 0 else "rclone is not working properly"
+        except FileNotFoundError:
+            issue = "rclone is not installed or not found in PATH"
+        except subprocess.TimeoutExpired:
+            issue = "rclone is not responding"
+        except Exception as e:
+            issue = f"Error checking rclone: {e}"
+        
+        RcloneManager._version_cache = {key: (time.monotonic(), issue)}
+        return issue
+    
+    def _rclone_version(self, executable: str) -> Optional[tuple]:
+        """Return (major, minor) of an rclone binary, probing it once per install."""
+        resolved = shutil.which(executable) or executable
+        try:
+            key = (resolved, os.path.getmtime(resolved))
+        except OSError:
+            return None
+        if key in RcloneManager._version_numbers:
+            return RcloneManager._version_numbers[key]
+        
+        version = None
+        try:
+            result = self._run_hidden_subprocess([resolved, "version"],
+                                                 capture_output=True, text=True, timeout=10)
+            match = re.search(r'rclone v(\d+)\.(\d+)', result.stdout)
+            if match:
+                version = (int(match.group(1)), int(match.group(2)))
+        except Exception as e:
+            print(f"Could not read rclone version: {e}")
+        RcloneManager._version_numbers[key] = version
+        return version
+    
+    def _mount_flags(self, executable: str) -> tuple:
+        """VFS flags for `rclone mount`, without any the given binary is too old for."""
+        version = self._rclone_version(executable)
+        flags = self.VFS_MOUNT_FLAGS
+        for minimum, extra in self.VFS_VERSIONED_FLAGS:
+            if version is not None and version >= minimum:
+                flags += extra
+        return flags
+    
     def _check_winfsp_installation(self):
         """Check if WinFsp is properly installed on Windows."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return True
-            
+        
+        # Reuse a recent probe; it stats several files and shells out to `sc`
+        now = time.monotonic()
+        if self._winfsp_check and now < self._winfsp_check[0]:
+            return self._winfsp_check[1]
+        installed = self._probe_winfsp_installation()
+        self._winfsp_check = (now + self.WINFSP_CACHE_TTL, installed)
+        return installed
+    
+    @staticmethod
+    def _any_path_exists(paths: List[str]) -> bool:
+        """Check candidate files, listing each directory once when it holds several candidates."""
+        by_dir: Dict[str, List[str]] = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), []).append(os.path.basename(path))
+        
+        for directory, names in by_dir.items():
+            if len(names) == 1:
+                if os.path.exists(os.path.join(directory, names[0])):
+                    return True
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    # Windows file names are case-insensitive
+                    present = {entry.name.lower() for entry in entries}
+            except OSError:
+                continue
+            if any(name.lower() in present for name in names):
+                return True
+        return False
+    
+    def _probe_winfsp_installation(self):
+        """Look for WinFsp files and its service."""
         # Check multiple possible WinFsp installation paths
         winfsp_paths = [
             r"C:\Program Files\WinFsp\bin\launchctl-x64.exe",
@@ -426,20 +1311,20 @@ class RcloneManager:
         ]
         
         # Check if any WinFsp files exist
-        winfsp_found = any(os.path.exists(path) for path in winfsp_paths)
+        winfsp_found = self._any_path_exists(winfsp_paths)
         
         if winfsp_found:
             # Also try to verify WinFsp service is available
             try:
                 # Check for WinFsp.Launcher service (newer versions)
-                result = subprocess.run(['sc', 'query', 'WinFsp.Launcher'], 
-                                      capture_output=True, text=True, timeout=5)
+                result = self._run_hidden_subprocess(['sc', 'query', 'WinFsp.Launcher'], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 if result.returncode == 0:
                     return True
                 
                 # Fallback to check for WinFsp service (older versions)
-                result = subprocess.run(['sc', 'query', 'WinFsp'], 
-                                      capture_output=True, text=True, timeout=5)
+                result = self._run_hidden_subprocess(['sc', 'query', 'WinFsp'], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return result.returncode == 0
             except:
                 # If service check fails, but files exist, assume it's installed
@@ -449,9 +1334,14 @@ class RcloneManager:
     
     def _find_bundled_winfsp_installer(self):
         """Find bundled WinFsp installer."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return None
-            
+        return self._locate_bundled_winfsp_installer()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _locate_bundled_winfsp_installer():
+        """Search for the bundled installer once per process; it can't move while we run."""
         possible_locations = [
             os.path.join(os.path.dirname(sys.executable), "winfsp-installer.msi"),
             os.path.join(os.path.dirname(os.path.abspath(__file__)), "winfsp-installer.msi"),
@@ -466,7 +1356,7 @@ class RcloneManager:
     
     def install_winfsp(self, parent_widget=None):
         """Install WinFsp using bundled installer."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return False
             
         installer_path = self._find_bundled_winfsp_installer()
@@ -474,8 +1364,6 @@ class RcloneManager:
             return False
             
         try:
-            from PyQt6.QtWidgets import QMessageBox
-            
             if parent_widget:
                 reply = QMessageBox.question(
                     parent_widget,
@@ -495,6 +1383,8 @@ class RcloneManager:
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
+                # Forget the cached "not installed" result
+                self._winfsp_check = None
                 if parent_widget:
                     QMessageBox.information(
                         parent_widget,
@@ -525,21 +1415,116 @@ class RcloneManager:
     
     def setup_rclone_config(self, username: str, password: str):
         """Setup rclone configuration for the user."""
-        config = configparser.ConfigParser()
+        section_name = f"haio_{username}"
+        values = {
+            'type': 'swift',
+            'user': f'{username}:{username}',
+            'key': password,
+            'auth': 'https://drive.haio.ir/auth/v1.0',
+        }
+        
+        # Hold the lock across read+write so the GUI and the auto-mount
+        # service can't interleave and drop each other's sections
+        with self._config_lock():
+            self._upsert_rclone_section(section_name, values)
+    
+    @contextlib.contextmanager
+    def _config_lock(self):
+        """Exclusive advisory lock guarding read-modify-write of rclone.conf."""
+        # rclone.conf itself is swapped by os.replace, so lock a sidecar file
+        # whose inode stays put
+        os.makedirs(self.config_dir, exist_ok=True)
+        with open(self.config_path + ".lock", 'a+') as lock_file:
+            if _IS_WINDOWS:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if _IS_WINDOWS:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _upsert_rclone_section(self, section_name: str, values: Dict[str, str]):
+        """Write the user's section into rclone.conf unless it already matches."""
+        try:
+            with open(self.config_path, 'r') as f:
+                original = content = f.read()
+        except FileNotFoundError:
+            original = content = ""
+        
+        # Only our one section changes, so patch it in place rather than
+        # round-tripping the whole file through configparser
+        lines = content.splitlines(keepends=True)
+        headers = [i for i, line in enumerate(lines) if line.strip() == f"[{section_name}]"]
+        if len(headers) > 1:
+            # Unusual file (duplicate sections) - let configparser sort it out
+            self._setup_rclone_config_configparser(section_name, values)
+            return
+        
+        if not headers:
+            if content and not content.endswith("\n"):
+                content += "\n"
+            if content.strip():
+                content += "\n"
+            content += f"[{section_name}]\n" + "".join(f"{k} = {v}\n" for k, v in values.items())
+        else:
+            start = headers[0] + 1
+            end = next((i for i in range(start, len(lines)) if lines[i].lstrip().startswith('[')), len(lines))
+            body = []
+            pending = dict(values)
+            for line in lines[start:end]:
+                key = line.split('=', 1)[0].strip().lower() if '=' in line else None
+                if key in pending:
+                    body.append(f"{key} = {pending.pop(key)}\n")
+                else:
+                    body.append(line)
+            # Add missing keys ahead of the blank lines separating the next section
+            insert_at = len(body)
+            while insert_at > 0 and not body[insert_at - 1].strip():
+                insert_at -= 1
+            if insert_at > 0 and not body[insert_at - 1].endswith("\n"):
+                body[insert_at - 1] += "\n"
+            body[insert_at:insert_at] = [f"{k} = {v}\n" for k, v in pending.items()]
+            content = "".join(lines[:start] + body + lines[end:])
+        
+        # Already configured (the usual case on re-login) - leave the file alone
+        if content == original:
+            return
+        
+        self._write_rclone_config(content)
+    
+    def _write_rclone_config(self, content: str):
+        """Atomically replace rclone.conf so a crash never leaves it half-written."""
+        fd, temp_path = tempfile.mkstemp(dir=self.config_dir, prefix=".rclone.conf.")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _setup_rclone_config_configparser(self, section_name: str, values: Dict[str, str]):
+        """Upsert a config section with configparser (fallback for unusual files)."""
+        import configparser
+        config = configparser.ConfigParser(interpolation=None, strict=False)
         
         # Read existing config if it exists
         if os.path.exists(self.config_path):
             config.read(self.config_path)
         
         # Add or update the user's config section
-        section_name = f"haio_{username}"
         if not config.has_section(section_name):
             config.add_section(section_name)
         
-        config.set(section_name, 'type', 'swift')
-        config.set(section_name, 'user', f'{username}:{username}')
-        config.set(section_name, 'key', password)
-        config.set(section_name, 'auth', 'https://drive.haio.ir/auth/v1.0')
+        for key, value in values.items():
+            config.set(section_name, key, value)
         
         # Write config
         with open(self.config_path, 'w') as f:
@@ -556,7 +1541,7 @@ class RcloneManager:
                 '--timeout', '10s'
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+            result = self._run_hidden_subprocess(cmd, capture_output=True, text=True, timeout=15)
             
             if result.returncode == 0:
                 return True, "Configuration test successful"
@@ -575,10 +1560,10 @@ class RcloneManager:
         """Mount a bucket using rclone."""
         try:
             # Check if mount point is a drive letter or folder path
-            if platform.system() == "Windows" and mount_point.endswith(':'):
+            if _IS_WINDOWS and mount_point.endswith(':'):
                 # Mount point is a drive letter - use it directly
-                print(f"Using assigned drive letter {mount_point} for mounting {bucket_name}")
-            elif platform.system() == "Windows":
+                log.info("Using assigned drive letter %s for mounting %s", mount_point, bucket_name)
+            elif _IS_WINDOWS:
                 # Mount point is a folder path on Windows - ensure it doesn't exist or is empty
                 if os.path.exists(mount_point):
                     if os.path.isdir(mount_point) and not os.listdir(mount_point):
@@ -597,24 +1582,24 @@ class RcloneManager:
                     # Check if it's a stale/broken mount point
                     if not os.path.isdir(mount_point):
                         # It's a file or broken mount - try to clean it up
-                        print(f"Found broken mount point at {mount_point}, attempting cleanup...")
+                        log.warning("Found broken mount point at %s, attempting cleanup...", mount_point)
                         try:
                             # First try to unmount in case it's a stale mount
                             unmount_success, unmount_msg = self.unmount_bucket(mount_point)
                             if unmount_success:
-                                print(f"Successfully cleaned up stale mount at {mount_point}")
+                                log.info("Successfully cleaned up stale mount at %s", mount_point)
                             else:
-                                print(f"Unmount attempt: {unmount_msg}")
+                                log.info("Unmount attempt: %s", unmount_msg)
                             
                             # Try to remove the mount point if it still exists
                             if os.path.exists(mount_point):
                                 # Check if it's still not a directory after unmount
                                 if not os.path.isdir(mount_point):
                                     os.remove(mount_point)
-                                    print(f"Removed stale mount point file: {mount_point}")
+                                    log.info("Removed stale mount point file: %s", mount_point)
                         except Exception as cleanup_error:
                             error_msg = f"Mount point {mount_point} exists but cannot be cleaned up: {cleanup_error}"
-                            print(error_msg)
+                            log.warning(error_msg)
                             return False, error_msg
                     elif os.listdir(mount_point):
                         # Directory exists and is not empty - might be a valid mount or user data
@@ -631,7 +1616,7 @@ class RcloneManager:
                 return True, f"Bucket {bucket_name} is already mounted at {mount_point}"
             
             # Check dependencies before mounting
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 if not self._check_winfsp_installation():
                     return False, "WinFsp is not installed. Please install WinFsp before mounting."
             
@@ -643,20 +1628,13 @@ class RcloneManager:
             # Setup rclone mount command
             config_name = f"haio_{username}"
             
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # Windows-specific mount command with WinFsp optimizations
                 cmd = [
                     self.rclone_executable, 'mount',
                     # Note: --daemon is not supported on Windows
                     '--allow-non-empty',
-                    '--dir-cache-time', '10s',
-                    '--poll-interval', '1m',
-                    '--vfs-cache-mode', 'full',
-                    '--vfs-cache-max-age', '24h',
-                    '--vfs-write-back', '10s',
-                    '--vfs-read-wait', '20ms',
-                    '--buffer-size', '32M',
-                    '--attr-timeout', '1m',
+                    *self._mount_flags(self.rclone_executable),
                     '--cache-dir', self.cache_dir,
                     '--config', self.config_path,
                     # Windows-specific WinFsp options
@@ -675,14 +1653,7 @@ class RcloneManager:
                     self.rclone_executable, 'mount',
                     '--daemon',
                     '--allow-non-empty',
-                    '--dir-cache-time', '10s',
-                    '--poll-interval', '1m',
-                    '--vfs-cache-mode', 'full',
-                    '--vfs-cache-max-age', '24h',
-                    '--vfs-write-back', '10s',
-                    '--vfs-read-wait', '20ms',
-                    '--buffer-size', '32M',
-                    '--attr-timeout', '1m',
+                    *self._mount_flags(self.rclone_executable),
                     '--cache-dir', self.cache_dir,
                     '--config', self.config_path,
                 ]
@@ -693,13 +1664,12 @@ class RcloneManager:
                     mount_point
                 ]
             
-            print(f"Mounting {bucket_name} with command: {' '.join(cmd)}")
+            log.info("Mounting %s with command: %s", bucket_name, ' '.join(cmd))
             
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # On Windows, rclone mount runs in foreground, so we start it in background
                 # and check if the mount becomes available
                 import threading
-                import time
                 
                 def run_mount():
                     # Use helper function to hide console window
@@ -710,71 +1680,116 @@ class RcloneManager:
                 mount_thread.start()
                 
                 # Wait for mount to become available
-                for i in range(15):  # Wait up to 15 seconds
-                    time.sleep(1)
-                    if self.is_mounted(mount_point):
-                        print(f"Mount verification successful for {bucket_name} (took {i+1} seconds)")
-                        return True, f"Successfully mounted {bucket_name} at {mount_point}"
-                    print(f"Waiting for mount... ({i+1}/15)")
+                waited = self._wait_for_mount(mount_point, timeout=15)
+                if waited is not None:
+                    log.info("Mount verification successful for %s (took %.1f seconds)", bucket_name, waited)
+                    return True, f"Successfully mounted {bucket_name} at {mount_point}"
                 
                 # If we get here, mount didn't become available
                 error_msg = f"Mount command started but mount point did not become available for {bucket_name} after 15 seconds"
-                print(error_msg)
+                log.warning(error_msg)
                 return False, error_msg
                 
             else:
-                # Linux/Unix - use daemon mode
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                # Linux/Unix - use daemon mode. Output goes to a temp file rather than
+                # pipes: the daemonized child can inherit them, which would keep
+                # the read open until the timeout even though the mount succeeded
+                with tempfile.TemporaryFile(mode='w+') as output_file:
+                    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=output_file,
+                                            stderr=subprocess.STDOUT, text=True)
+                    try:
+                        returncode = proc.wait(timeout=30)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        proc.wait()
+                        raise
+                    output_file.seek(0)
+                    output = output_file.read().strip()
                 
-                if result.returncode == 0:
-                    print(f"Mount command completed successfully for {bucket_name}")
-                    # Wait a moment and check if mount is actually active
-                    import time
-                    time.sleep(2)
-                    if self.is_mounted(mount_point):
-                        print(f"Mount verification successful for {bucket_name}")
+                if returncode == 0:
+                    log.info("Mount command completed successfully for %s", bucket_name)
+                    # Check if mount is actually active (--daemon usually returns once it is)
+                    if self._wait_for_mount(mount_point, timeout=5) is not None:
+                        log.info("Mount verification successful for %s", bucket_name)
                         return True, f"Successfully mounted {bucket_name}"
                     else:
                         error_msg = f"Mount command succeeded but mount point is not active for {bucket_name}"
-                        if result.stderr.strip():
-                            error_msg += f"\nError details: {result.stderr.strip()}"
-                        print(error_msg)
+                        if output:
+                            error_msg += f"\nError details: {output}"
+                        log.warning(error_msg)
                         return False, error_msg
                 else:
-                    error_msg = f"Mount command failed for {bucket_name} (code: {result.returncode})"
-                    if result.stderr.strip():
-                        error_msg += f"\nError: {result.stderr.strip()}"
-                    elif result.stdout.strip():
-                        error_msg += f"\nOutput: {result.stdout.strip()}"
-                    print(error_msg)
+                    error_msg = f"Mount command failed for {bucket_name} (code: {returncode})"
+                    if output:
+                        error_msg += f"\nError: {output}"
+                    log.warning(error_msg)
                     return False, error_msg
             
         except subprocess.TimeoutExpired:
             error_msg = f"Mount command timed out for {bucket_name}"
-            print(error_msg)
+            log.warning(error_msg)
             return False, error_msg
         except Exception as e:
             error_msg = f"Error mounting {bucket_name}: {str(e)}"
-            print(error_msg)
+            log.warning(error_msg)
             import traceback
             traceback.print_exc()
             return False, error_msg
     
+    def _wait_for_mount(self, mount_point: str, timeout: float, interval: float = 0.2) -> Optional[float]:
+        """Wait until mount_point is mounted; return seconds waited, or None on timeout."""
+        start = time.monotonic()
+        
+        # On Linux the kernel flags /proc/self/mountinfo (POLLPRI) whenever the mount
+        # table changes, so we can wake up as soon as the FUSE mount appears
+        mountinfo = None
+        poller = None
+        if hasattr(select, 'poll'):
+            try:
+                mountinfo = open('/proc/self/mountinfo', 'rb')
+                mountinfo.read()
+                poller = select.poll()
+                poller.register(mountinfo, select.POLLPRI | select.POLLERR)
+            except OSError:
+                if mountinfo:
+                    mountinfo.close()
+                mountinfo = None
+        
+        try:
+            while True:
+                if self.is_mounted(mount_point):
+                    return time.monotonic() - start
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    return None
+                if poller:
+                    # Recheck at least once a second in case the mount shows up but isn't serving yet
+                    if poller.poll(int(min(remaining, 1.0) * 1000)):
+                        # Re-reading re-arms the change notification
+                        mountinfo.seek(0)
+                        mountinfo.read()
+                else:
+                    time.sleep(min(interval, remaining))
+        finally:
+            if mountinfo:
+                mountinfo.close()
+    
     def unmount_bucket(self, mount_point: str) -> tuple[bool, str]:
         """Unmount a bucket. Returns (success, message)."""
         try:
-            if not os.path.exists(mount_point):
-                print(f"Mount point {mount_point} does not exist")
+            exists, mounted = self._mount_point_state(mount_point)
+            if not exists:
+                log.info("Mount point %s does not exist", mount_point)
                 return True, "Mount point does not exist (already unmounted)"
             
-            if not self.is_mounted(mount_point):
-                print(f"Mount point {mount_point} is not mounted")
+            if not mounted:
+                log.info("Mount point %s is not mounted", mount_point)
                 return True, "Not currently mounted"
             
-            print(f"Attempting to unmount {mount_point}")
+            log.info("Attempting to unmount %s", mount_point)
             
             # Try different unmount commands based on platform
-            if platform.system() == "Linux":
+            if _IS_LINUX:
                 # Try fusermount first (preferred for FUSE), then umount
                 commands = [
                     ['fusermount', '-u', mount_point],
@@ -784,18 +1799,18 @@ class RcloneManager:
                 
                 for cmd in commands:
                     try:
-                        print(f"Trying command: {' '.join(cmd)}")
+                        log.info("Trying command: %s", ' '.join(cmd))
                         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                         if result.returncode == 0:
-                            print(f"Successfully unmounted {mount_point}")
+                            log.info("Successfully unmounted %s", mount_point)
                             return True, f"Successfully unmounted {mount_point}"
                         else:
-                            print(f"Command failed with code {result.returncode}: {result.stderr}")
+                            log.warning("Command failed with code %s: %s", result.returncode, result.stderr)
                     except FileNotFoundError:
-                        print(f"Command not found: {cmd[0]}")
+                        log.warning("Command not found: %s", cmd[0])
                         continue
                     except subprocess.TimeoutExpired:
-                        print(f"Command timed out: {' '.join(cmd)}")
+                        log.warning("Command timed out: %s", ' '.join(cmd))
                         continue
                 
                 # If unmount failed due to busy device, try additional strategies
@@ -810,21 +1825,56 @@ class RcloneManager:
             
         except Exception as e:
             error_msg = f"Error unmounting {mount_point}: {e}"
-            print(error_msg)
+            log.warning(error_msg)
             return False, error_msg
     
+    def _mount_point_state(self, mount_point: str) -> tuple[bool, bool]:
+        """Return (exists, mounted) for a mount point from as few stat calls as possible."""
+        if _IS_WINDOWS:
+            exists = os.path.exists(mount_point)
+            return exists, exists and self.is_mounted(mount_point)
+        
+        try:
+            st = os.lstat(mount_point)
+        except FileNotFoundError:
+            return False, False
+        except OSError:
+            # ENOTCONN and friends: a dead FUSE mount that still needs unmounting
+            return True, True
+        parent = os.lstat(os.path.join(mount_point, '..'))
+        # Same check as os.path.ismount: a different device, or the filesystem root
+        return True, st.st_dev != parent.st_dev or st.st_ino == parent.st_ino
+    
     def _handle_busy_unmount(self, mount_point: str) -> tuple[bool, str]:
         """Handle unmount when device is busy."""
-        print(f"Mount point {mount_point} is busy, trying additional strategies...")
+        log.info("Mount point %s is busy, trying additional strategies...", mount_point)
         
-        # Check what processes are using the mount point
+        # A busy rclone mount is almost always a file manager holding an inode;
+        # a lazy FUSE unmount detaches it right away without hunting processes
+        for cmd in (['fusermount', '-uz', mount_point], ['fusermount3', '-uz', mount_point]):
+            try:
+                log.info("Trying lazy unmount: %s", ' '.join(cmd))
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
+                if result.returncode == 0:
+                    log.info("Lazy unmounted %s", mount_point)
+                    return True, f"Lazy unmounted {mount_point} (will complete when files are no longer in use)"
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                continue
+        
+        # The mount may have gone away on its own meanwhile; don't go looking
+        # for processes holding a mount that no longer exists
+        if self._in_proc_mountinfo(mount_point) is False:
+            log.info("%s is no longer mounted", mount_point)
+            return True, f"Successfully unmounted {mount_point}"
+        
+        # Check what processes are using the mount point (non-recursive: walking
+        # the whole remote with +D can take minutes; -t prints bare PIDs)
         try:
-            print("Checking for processes using the mount point...")
-            result = subprocess.run(['lsof', '+D', mount_point], 
+            log.info("Checking for processes using the mount point...")
+            result = subprocess.run(['lsof', '-t', mount_point], 
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
-                print("Processes using the mount point:")
-                print(result.stdout)
+                log.info("Processes using the mount point: %s", ' '.join(result.stdout.split()))
                 
                 # Try to kill file manager processes that might be accessing the mount
                 self._kill_file_managers(mount_point)
@@ -835,46 +1885,52 @@ class RcloneManager:
                 # Try unmount again
                 for cmd in [['fusermount', '-u', mount_point], ['umount', mount_point]]:
                     try:
-                        print(f"Retrying: {' '.join(cmd)}")
+                        log.info("Retrying: %s", ' '.join(cmd))
                         result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
                         if result.returncode == 0:
-                            print(f"Successfully unmounted {mount_point} after killing processes")
+                            log.info("Successfully unmounted %s after killing processes", mount_point)
                             return True, f"Successfully unmounted {mount_point} after closing interfering processes"
                     except:
                         continue
                         
         except FileNotFoundError:
-            print("lsof not available, skipping process check")
+            log.info("lsof not available, skipping process check")
         except Exception as e:
-            print(f"Error checking processes: {e}")
+            log.warning("Error checking processes: %s", e)
         
         # Try lazy unmount as last resort
         try:
-            print("Trying lazy unmount...")
+            log.info("Trying lazy unmount...")
             result = subprocess.run(['umount', '-l', mount_point], 
-                                  capture_output=True, text=True, timeout=10)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10)
             if result.returncode == 0:
-                print(f"Lazy unmounted {mount_point}")
+                log.info("Lazy unmounted %s", mount_point)
                 return True, f"Lazy unmounted {mount_point} (will complete when files are no longer in use)"
             else:
-                print(f"Lazy unmount failed: {result.stderr}")
+                log.warning("Lazy unmount failed: %s", result.stderr)
         except Exception as e:
-            print(f"Lazy unmount error: {e}")
+            log.warning("Lazy unmount error: %s", e)
         
-        print(f"All unmount strategies failed for {mount_point}")
+        log.warning("All unmount strategies failed for %s", mount_point)
         return False, f"Mount point {mount_point} is busy - close any applications accessing files in this location"
     
     def _kill_file_managers(self, mount_point: str):
         """Kill common file manager processes that might be accessing the mount."""
-        file_managers = ['nautilus', 'thunar', 'dolphin', 'nemo', 'pcmanfm']
+        file_managers = {'nautilus', 'thunar', 'dolphin', 'nemo', 'pcmanfm'}
         
-        for fm in file_managers:
+        # One pass over /proc instead of a pgrep + pkill pair per file manager
+        try:
+            pids = [entry for entry in os.listdir('/proc') if entry.isdigit()]
+        except OSError:
+            return
+        
+        for pid in pids:
             try:
-                # Check if the file manager is running
-                result = subprocess.run(['pgrep', fm], capture_output=True, timeout=3)
-                if result.returncode == 0:
-                    print(f"Killing {fm} file manager...")
-                    subprocess.run(['pkill', fm], timeout=3)
+                with open(f'/proc/{pid}/comm') as f:
+                    name = f.read().strip()
+                if name in file_managers:
+                    log.info("Killing %s file manager...", name)
+                    os.kill(int(pid), signal.SIGTERM)
             except:
                 continue
     
@@ -904,7 +1960,7 @@ class RcloneManager:
             print(f"Trying secondary targeted unmount methods for {drive_letter}")
             try:
                 import subprocess
-                wmic = subprocess.run(
+                wmic = self._run_hidden_subprocess(
                     ['wmic', 'process', 'where', 'name="rclone.exe"', 'get', 'processid,commandline'],
                     capture_output=True, text=True, timeout=10
                 )
@@ -920,7 +1976,7 @@ class RcloneManager:
                         print(f"WMIC found targeted rclone PIDs for {drive_letter}: {pids_to_kill}")
                         for pid in pids_to_kill:
                             try:
-                                subprocess.run(['taskkill', '/F', '/PID', pid], capture_output=True, text=True, timeout=5)
+                                self._run_hidden_subprocess(['taskkill', '/F', '/PID', pid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                             except Exception as e:
                                 print(f"Failed to kill PID {pid} via WMIC fallback: {e}")
                         time.sleep(2)
@@ -934,8 +1990,8 @@ class RcloneManager:
             
             # Last resort: try to disconnect the network drive (if it was mapped as such)
             try:
-                result = subprocess.run(['net', 'use', drive_letter, '/delete', '/y'], 
-                                      capture_output=True, text=True, timeout=10)
+                result = self._run_hidden_subprocess(['net', 'use', drive_letter, '/delete', '/y'], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10)
                 if result.returncode == 0:
                     print(f"Successfully disconnected network drive {drive_letter}")
                     return True, f"Successfully disconnected network drive {drive_letter}"
@@ -969,18 +2025,11 @@ class RcloneManager:
                 "Where-Object { $_.CommandLine -and ($_.CommandLine -like \"* $d*\") } | "
                 "Select-Object -ExpandProperty ProcessId"
             )
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-NonInteractive', '-Command', ps_cmd],
-                capture_output=True, text=True, timeout=10
-            )
             pids = []
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    line = line.strip()
-                    if line.isdigit():
-                        pids.append(line)
-            else:
-                print(f"PowerShell PID lookup failed: {result.stderr}")
+            for line in self._ps_run(ps_cmd, timeout=10).splitlines():
+                line = line.strip()
+                if line.isdigit():
+                    pids.append(line)
 
             if not pids:
                 print(f"No targeted rclone processes found for drive {dl}")
@@ -990,7 +2039,7 @@ class RcloneManager:
             killed_any = False
             for pid in pids:
                 try:
-                    subprocess.run(['taskkill', '/F', '/PID', pid], capture_output=True, text=True, timeout=5)
+                    self._run_hidden_subprocess(['taskkill', '/F', '/PID', pid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                     killed_any = True
                 except Exception as e:
                     print(f"Failed to kill PID {pid}: {e}")
@@ -1014,22 +2063,89 @@ class RcloneManager:
             # Check for common stale mount errors
             error_msg = str(e).lower()
             if 'transport endpoint is not connected' in error_msg:
-                print(f"Detected stale mount at {mount_point}: {e}")
+                log.warning("Detected stale mount at %s: %s", mount_point, e)
                 return True
             if 'not a directory' in error_msg:
-                print(f"Detected broken mount point at {mount_point}: {e}")
+                log.warning("Detected broken mount point at %s: %s", mount_point, e)
                 return True
             # Other OS errors might also indicate stale mount
-            print(f"Mount point {mount_point} has access error: {e}")
+            log.warning("Mount point %s has access error: %s", mount_point, e)
             return True
         except Exception as e:
-            print(f"Error checking if {mount_point} is stale: {e}")
+            log.warning("Error checking if %s is stale: %s", mount_point, e)
             return False
     
+    def _in_proc_mountinfo(self, mount_point: str) -> Optional[bool]:
+        """Check /proc/self/mountinfo for a mount point; None if /proc is unavailable."""
+        try:
+            with open('/proc/self/mountinfo', 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        target = self._mountinfo_key(os.path.realpath(mount_point))
+        for line in data.splitlines():
+            fields = line.split(b' ', 5)
+            if len(fields) > 4 and fields[4] == target:
+                return True
+        return False
+    
+    @staticmethod
+    def _mountinfo_key(path: str) -> bytes:
+        """Encode a resolved path the way mountinfo writes it (5th field, octal-escaped whitespace/backslashes)."""
+        target = os.fsencode(path)
+        return (target.replace(b'\\', b'\\134').replace(b' ', b'\\040')
+                .replace(b'\t', b'\\011').replace(b'\n', b'\\012'))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolved_dir(path: str) -> str:
+        """realpath of a mount point's parent directory (the home dir for every bucket)."""
+        return os.path.realpath(path)
+    
+    def snapshot_mounts(self) -> Optional[set]:
+        """Return the set of current mount points (mountinfo-escaped), re-read at most every MOUNT_SNAPSHOT_TTL.
+        
+        None if /proc/self/mountinfo isn't available (non-Linux).
+        """
+        now = time.monotonic()
+        if self._mount_snapshot and now - self._mount_snapshot[0] < self.MOUNT_SNAPSHOT_TTL:
+            return self._mount_snapshot[1]
+        if _IS_WINDOWS:
+            return None
+        try:
+            with open('/proc/self/mountinfo', 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        mounts = set()
+        for line in data.splitlines():
+            fields = line.split(b' ', 5)
+            if len(fields) > 4:
+                mounts.add(fields[4])
+        self._mount_snapshot = (now, mounts)
+        return mounts
+    
+    def invalidate_mount_snapshot(self):
+        """Forget the mount snapshot after a mount/unmount changed the table."""
+        self._mount_snapshot = None
+    
+    def is_mounted_cached(self, mount_point: str) -> bool:
+        """is_mounted for refreshing many widgets at once: one mountinfo read shared by all.
+        
+        Unlike is_mounted, a dead FUSE mount counts as mounted here, so the
+        widget offers to unmount it.
+        """
+        mounts = self.snapshot_mounts()
+        if mounts is None:
+            return self.is_mounted(mount_point)
+        parent, name = os.path.split(os.path.normpath(mount_point))
+        return self._mountinfo_key(os.path.join(self._resolved_dir(parent), name)) in mounts
+    
     def is_mounted(self, mount_point: str) -> bool:
         """Check if a mount point is currently mounted."""
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # On Windows, check if the drive letter is accessible
                 if mount_point.endswith(':'):
                     drive_letter = mount_point
@@ -1048,60 +2164,132 @@ class RcloneManager:
                     # For folder paths, check if it exists and has content
                     return os.path.exists(mount_point) and os.path.ismount(mount_point)
             else:
-                # Linux/Unix: use mountpoint command first, then check for stale mount
-                import subprocess
-                result = subprocess.run(['mountpoint', '-q', mount_point], capture_output=True)
-                if result.returncode == 0:
+                # Linux/Unix: ismount is just an lstat of the path and its parent.
+                # A dead FUSE mount fails that lstat and reports False, which is
+                # what we return for stale mounts anyway
+                mounted = os.path.ismount(mount_point)
+                if mounted:
                     # mountpoint says it's mounted, but check if it's stale
                     if self.is_stale_mount(mount_point):
                         return False  # It's mounted but stale
                     return True
                 return False
         except Exception as e:
-            print(f"Error checking mount status for {mount_point}: {e}")
+            log.warning("Error checking mount status for %s: %s", mount_point, e)
             return False
     
     def create_systemd_service(self, username: str, bucket_name: str, mount_point: str, parent_widget=None) -> bool:
-        """Create a systemd service for persistent mounting. Linux only."""
-        if platform.system() != "Linux":
+        """Create a systemd user service for persistent mounting. Linux only."""
+        if not _IS_LINUX:
             if parent_widget:
                 QMessageBox.information(parent_widget, "Not Supported", 
                                       "Auto-mount at boot is only supported on Linux systems.")
             return False
-            
+        
+        return self.create_systemd_services(username, [(bucket_name, mount_point)], parent_widget)[bucket_name]
+    
+    def create_systemd_services(self, username: str, specs: List[tuple], parent_widget=None) -> Dict[str, bool]:
+        """Create systemd user services for several (bucket_name, mount_point) pairs at once.
+        
+        All unit files are written first, then the user manager is reloaded and
+        the units enabled with one systemctl call each. Linux only.
+        """
+        results = {bucket_name: False for bucket_name, _ in specs}
+        if not _IS_LINUX or not specs:
+            return results
+        
+        written = {}
         try:
-            service_name = f"haio-{username}-{bucket_name}.service"
-            service_path = f"{self.service_dir}/{service_name}"
-            config_name = f"haio_{username}"
-            
-            # For systemd services, always use system rclone path (not temp PyInstaller path)
-            # Check common locations for rclone
-            system_rclone = "/usr/bin/rclone"
-            if not os.path.exists(system_rclone):
-                system_rclone = "/usr/local/bin/rclone"
-            if not os.path.exists(system_rclone):
-                # Try to find it in PATH
-                try:
-                    result = subprocess.run(['which', 'rclone'], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        system_rclone = result.stdout.strip()
-                except:
-                    pass
-            
-            # Get current username for running service as user
-            import getpass
-            current_user = getpass.getuser()
-            
-            service_content = f"""[Unit]
+            system_rclone = self._system_rclone_path()
+            
+            # Install as user units; only the user's own manager reloads
+            os.makedirs(self.user_service_dir, exist_ok=True)
+            for bucket_name, mount_point in specs:
+                service_name = f"haio-{username}-{bucket_name}.service"
+                service_path = os.path.join(self.user_service_dir, service_name)
+                with open(service_path, 'w') as f:
+                    f.write(self._systemd_unit(username, bucket_name, mount_point, system_rclone))
+                written[bucket_name] = (service_name, service_path)
+            
+            self._service_states.clear()
+            reload_cmd = ['systemctl', '--user', 'daemon-reload']
+            result = subprocess.run(reload_cmd, capture_output=True, text=True, timeout=15)
+            if result.returncode != 0:
+                print(f"{' '.join(reload_cmd)} failed: {result.stderr.strip()}")
+            else:
+                names = [service_name for service_name, _ in written.values()]
+                # enable without --now: the unit is for the next login/boot; the
+                # current session's mount belongs to the Mount button, and starting
+                # the unit here could stack a second rclone on an existing mount
+                result = subprocess.run(['systemctl', '--user', 'enable', *names],
+                                        capture_output=True, text=True, timeout=15 + 5 * len(names))
+                if result.returncode == 0:
+                    results = dict.fromkeys(results, True)
+                else:
+                    # Something in the batch failed; enable one at a time to find out what
+                    for bucket_name, (service_name, _) in written.items():
+                        result = subprocess.run(['systemctl', '--user', 'enable', service_name],
+                                                capture_output=True, text=True, timeout=15)
+                        results[bucket_name] = result.returncode == 0
+                        if result.returncode != 0:
+                            print(f"systemctl --user enable {service_name} failed: {result.stderr.strip()}")
+        except Exception as e:
+            print(f"Error creating systemd service: {e}")
+        
+        # Don't leave units behind that weren't enabled
+        failed = [written[bucket_name][1] for bucket_name, ok in results.items()
+                  if not ok and bucket_name in written]
+        if failed:
+            for service_path in failed:
+                with contextlib.suppress(OSError):
+                    os.remove(service_path)
+            with contextlib.suppress(Exception):
+                subprocess.run(['systemctl', '--user', 'daemon-reload'], capture_output=True, timeout=15)
+        
+        # User units only start at boot if the user lingers; sudo is needed at most once for that
+        if any(results.values()):
+            self._ensure_linger(parent_widget)
+        return results
+    
+    def _system_rclone_path(self) -> str:
+        """Locate a system rclone for systemd units (never the temporary PyInstaller copy)."""
+        # Check common locations for rclone
+        system_rclone = "/usr/bin/rclone"
+        if not os.path.exists(system_rclone):
+            system_rclone = "/usr/local/bin/rclone"
+        if not os.path.exists(system_rclone):
+            # Try to find it in PATH
+            try:
+                result = subprocess.run(['which', 'rclone'], capture_output=True, text=True)
+                if result.returncode == 0:
+                    system_rclone = result.stdout.strip()
+            except:
+                pass
+        return system_rclone
+    
+    def _systemd_unit(self, username: str, bucket_name: str, mount_point: str, system_rclone: str) -> str:
+        """Render the systemd user unit that mounts one bucket."""
+        config_name = f"haio_{username}"
+        
+        # Same VFS flags as an interactive mount, one option (and its value) per line
+        flag_lines = []
+        for arg in self._mount_flags(system_rclone):
+            if arg.startswith('--'):
+                flag_lines.append(arg)
+            else:
+                flag_lines[-1] += f" {arg}"
+        vfs_flags = "".join(f"        {line} \\\n" for line in flag_lines)
+        
+        # User units run as the desktop user, so no User= line and no sudo needed.
+        # The system's network-online.target isn't visible to the user manager;
+        # Restart=on-failure covers a mount attempted before the network is up.
+        return f"""[Unit]
 Description=Haio Drive Mount - {bucket_name}
-After=network-online.target
-Wants=network-online.target
 StartLimitIntervalSec=60
 StartLimitBurst=3
 
 [Service]
 Type=simple
-User={current_user}
 Environment=DrivePathDirectory="{mount_point}"
 Environment=CachePathDirectory="{self.cache_dir}"
 Environment=RcloneConfig="{self.config_path}"
@@ -1112,15 +2300,7 @@ ExecStartPre=/bin/mkdir -p "${{DrivePathDirectory}}"
 ExecStartPre=/bin/mkdir -p "${{CachePathDirectory}}"
 ExecStart={system_rclone} mount \\
         --allow-non-empty \\
-        --dir-cache-time 10s \\
-        --poll-interval 1m \\
-        --vfs-cache-mode full \\
-        --vfs-cache-max-age 24h \\
-        --vfs-write-back 10s \\
-        --vfs-read-wait 20ms \\
-        --buffer-size 32M \\
-        --attr-timeout 1m \\
-        --cache-dir "${{CachePathDirectory}}" \\
+{vfs_flags}        --cache-dir "${{CachePathDirectory}}" \\
         --config "${{RcloneConfig}}" \\
         --log-level INFO \\
         "${{ConfigName}}:${{ContainerName}}" "${{DrivePathDirectory}}"
@@ -1135,52 +2315,94 @@ TimeoutStartSec=30
 TimeoutStopSec=10
 
 [Install]
-WantedBy=multi-user.target
+WantedBy=default.target
 """
-            
-            # Ask for password using GUI
-            if parent_widget:
-                password_dialog = PasswordDialog(
-                    parent_widget, 
-                    f"System password required to create auto-mount service for '{bucket_name}'.\n"
-                    "This will create a systemd service that automatically mounts your bucket at boot."
-                )
-                
-                if password_dialog.exec() != QDialog.DialogCode.Accepted:
-                    return False
-                    
-                password = password_dialog.get_password()
-                if not password:
-                    return False
-            else:
-                # Fallback - should not happen in GUI app
-                return False
-            
-            # Write service file to temp location first
-            temp_file = f"/tmp/{service_name}"
-            with open(temp_file, 'w') as f:
-                f.write(service_content)
-            
-            # Move to systemd directory with sudo using GUI password
-            commands = [
-                f'echo "{password}" | sudo -S mv "{temp_file}" "{service_path}"',
-                f'echo "{password}" | sudo -S systemctl daemon-reload',
-                f'echo "{password}" | sudo -S systemctl enable "{service_name}"'
-            ]
-            
-            for cmd in commands:
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if result.returncode != 0:
-                    # Clean up temp file if it still exists
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                    return False
-            
+    
+    def _ensure_linger(self, parent_widget=None) -> bool:
+        """Enable systemd lingering so user units start at boot, asking for sudo only if needed."""
+        # Once confirmed (usually by the worker thread that created the units),
+        # the GUI-thread follow-up call doesn't need to spawn loginctl again
+        if self._linger_enabled:
             return True
-            
-        except Exception as e:
-            print(f"Error creating systemd service: {e}")
+        saved_state = self._read_linger_state()
+        if saved_state == 'enabled':
+            self._linger_enabled = True
+            return True
+        if saved_state == 'declined':
+            return False
+        import getpass, shlex
+        current_user = getpass.getuser()
+        # The worker that created the units usually ran this probe already; the
+        # GUI-thread follow-up then only needs to show the password dialog
+        if self._linger_probe is None:
+            try:
+                result = subprocess.run(['loginctl', 'show-user', current_user, '--property=Linger', '--value'],
+                                        capture_output=True, text=True, timeout=5)
+                if result.stdout.strip() == 'yes':
+                    self._linger_enabled = True
+                    self._write_linger_state('enabled')
+                    return True
+                
+                # polkit usually lets users enable lingering for themselves
+                result = subprocess.run(['loginctl', 'enable-linger', current_user],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+                if result.returncode == 0:
+                    self._linger_enabled = True
+                    self._write_linger_state('enabled')
+                    return True
+                self._linger_probe = 'needs_sudo'
+            except Exception as e:
+                # Don't retry (and possibly hang again) from the GUI thread
+                print(f"Error checking systemd linger: {e}")
+                self._linger_probe = 'error'
+        
+        if self._linger_probe == 'error' or not parent_widget:
             return False
+        password_dialog = PasswordDialog(
+            parent_widget,
+            "System password required once so your auto-mount services can start at boot.\n"
+            "Without it they will start when you log in. You can do this later from the Tools menu."
+        )
+        if password_dialog.exec() != QDialog.DialogCode.Accepted or not password_dialog.get_password():
+            print("⚠️  Lingering not enabled; auto-mount will start at login instead of boot")
+            self._write_linger_state('declined')
+            return False
+        try:
+            result = self._run_sudo_script(password_dialog.get_password(),
+                                           f"loginctl enable-linger {shlex.quote(current_user)}\n", timeout=15)
+            self._linger_enabled = result.returncode == 0
+            if self._linger_enabled:
+                self._write_linger_state('enabled')
+            return self._linger_enabled
+        except subprocess.TimeoutExpired:
+            return False
+    
+    def linger_declined(self) -> bool:
+        """Whether the user turned down the sudo prompt for starting auto-mounts at boot."""
+        return _IS_LINUX and not self._linger_enabled and self._read_linger_state() == 'declined'
+    
+    def retry_linger(self, parent_widget=None) -> bool:
+        """Forget an earlier decline and ask for lingering again."""
+        with contextlib.suppress(OSError):
+            os.remove(self._linger_state_path)
+        return self._ensure_linger(parent_widget)
+    
+    def _read_linger_state(self) -> Optional[str]:
+        """Return the remembered linger outcome ('enabled' or 'declined'), if any."""
+        try:
+            with open(self._linger_state_path, 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    
+    def _write_linger_state(self, state: str):
+        """Remember a linger outcome so later runs skip loginctl and the sudo prompt."""
+        try:
+            os.makedirs(_APP_CONFIG_DIR, exist_ok=True)
+            with open(self._linger_state_path, 'w') as f:
+                f.write(state + "\n")
+        except OSError as e:
+            print(f"Could not save linger state: {e}")
     
     def remove_systemd_service(self, username: str, bucket_name: str, parent_widget=None) -> bool:
         """Remove systemd service for a bucket. Linux only.
@@ -1188,12 +2410,28 @@ WantedBy=multi-user.target
         Returns:
             bool: True if service was removed successfully, False if cancelled or failed
         """
-        if platform.system() != "Linux":
+        if not _IS_LINUX:
             return True  # Nothing to remove on non-Linux systems
             
         try:
             service_name = f"haio-{username}-{bucket_name}.service"
             
+            # Current user units are removed without any privileges
+            user_service_path = os.path.join(self.user_service_dir, service_name)
+            if os.path.exists(user_service_path):
+                print(f"  Disabling, stopping and removing {service_name}...")
+                subprocess.run(['systemctl', '--user', 'disable', service_name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+                subprocess.run(['systemctl', '--user', 'stop', service_name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+                os.remove(user_service_path)
+                subprocess.run(['systemctl', '--user', 'daemon-reload'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+                self._service_states.clear()
+                print(f"    ✅ Service removed")
+                return True
+            
+            # Nothing to do unless a legacy system-wide unit is installed
+            if not os.path.exists(f"{self.service_dir}/{service_name}"):
+                return True
+            
             # Ask for password using GUI
             if parent_widget:
                 password_dialog = PasswordDialog(
@@ -1216,29 +2454,33 @@ WantedBy=multi-user.target
                 print(f"⚠️  No parent widget provided for password dialog")
                 return False
             
-            # Remove service with sudo using GUI password
-            commands = [
-                (f'echo "{password}" | sudo -S systemctl disable "{service_name}"', "Disabling service"),
-                (f'echo "{password}" | sudo -S systemctl stop "{service_name}"', "Stopping service"),
-                (f'echo "{password}" | sudo -S rm -f "{self.service_dir}/{service_name}"', "Removing service file"),
-                (f'echo "{password}" | sudo -S systemctl daemon-reload', "Reloading systemd")
-            ]
-            
-            all_success = True
-            for cmd, description in commands:
-                print(f"  {description}...")
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                if result.returncode != 0 and result.stderr:
-                    # Check if it's just "not found" error (service doesn't exist - that's ok)
-                    if 'No such file' not in result.stderr and 'not loaded' not in result.stderr:
-                        print(f"    ⚠️  {description} failed: {result.stderr.strip()}")
-                        all_success = False
-                    else:
-                        print(f"    ℹ️  {description}: Service already removed or doesn't exist")
-                else:
-                    print(f"    ✅ {description} completed")
+            # Remove service with sudo using GUI password (one sudo call; keep
+            # going past individual failures like the service already being gone)
+            import shlex
+            quoted_service = shlex.quote(service_name)
+            script = (
+                "rc=0\n"
+                f"systemctl disable {quoted_service} || rc=1\n"
+                f"systemctl stop {quoted_service} || rc=1\n"
+                f"rm -f {shlex.quote(f'{self.service_dir}/{service_name}')} || rc=1\n"
+                "systemctl daemon-reload || rc=1\n"
+                "exit $rc\n"
+            )
+            print(f"  Disabling, stopping and removing {service_name}...")
+            result = self._run_sudo_script(password, script, timeout=40)
+            self._service_states.clear()
+            if result.returncode == 0:
+                print(f"    ✅ Service removed")
+                return True
             
-            return all_success
+            # Check if it's just "not found" errors (service doesn't exist - that's ok)
+            errors = [line for line in result.stderr.splitlines()
+                      if line.strip() and 'No such file' not in line and 'not loaded' not in line]
+            if errors:
+                print(f"    ⚠️  Removing service failed: {' '.join(errors)}")
+                return False
+            print(f"    ℹ️  Service already removed or doesn't exist")
+            return True
             
         except subprocess.TimeoutExpired:
             print(f"❌ Timeout while removing systemd service: {service_name}")
@@ -1249,31 +2491,58 @@ WantedBy=multi-user.target
             traceback.print_exc()
             return False
 
+    def _run_sudo_script(self, password: str, script: str, timeout: Optional[float] = None):
+        """Run a shell script as root with a single sudo call, feeding the password on stdin."""
+        # -k makes sudo always read the password line, so it never reaches bash;
+        # the password also stays out of argv and the process list
+        return subprocess.run(['sudo', '-k', '-S', '-p', '', 'bash', '-s'],
+                              input=f"{password}\n{script}", capture_output=True,
+                              text=True, timeout=timeout)
+    
     def is_systemd_service_enabled(self, username: str, bucket_name: str) -> bool:
         """Check if systemd service exists and is enabled for auto-mount. Linux only."""
-        if platform.system() != "Linux":
+        if not _IS_LINUX:
             return False
             
         try:
             service_name = f"haio-{username}-{bucket_name}.service"
             
-            # Check if service file exists
-            service_path = f"{self.service_dir}/{service_name}"
-            if not os.path.exists(service_path):
+            # Check if service file exists (user unit, or a legacy system-wide one)
+            if os.path.exists(os.path.join(self.user_service_dir, service_name)):
+                user_scope = True
+            elif os.path.exists(f"{self.service_dir}/{service_name}"):
+                user_scope = False
+            else:
                 return False
             
             # Check if service is enabled
-            result = subprocess.run(['systemctl', 'is-enabled', service_name], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0 and result.stdout.strip() == 'enabled'
+            return self._systemd_service_states(user_scope).get(service_name) == 'enabled'
             
         except Exception as e:
             print(f"Error checking systemd service: {e}")
             return False
+    
+    def _systemd_service_states(self, user_scope: bool = True) -> Dict[str, str]:
+        """Return enablement state of all haio-* units, from one recent systemctl query."""
+        now = time.monotonic()
+        cached = self._service_states.get(user_scope)
+        if cached and now - cached[0] < self.SERVICE_STATE_TTL:
+            return cached[1]
+        
+        cmd = ['systemctl'] + (['--user'] if user_scope else []) + [
+            'list-unit-files', '--type=service', '--no-legend', 'haio-*.service']
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        states = {}
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2:
+                states[parts[0]] = parts[1]
+        self._service_states[user_scope] = (now, states)
+        return states
 
     def _is_admin(self):
         """Check if the current process is running as administrator."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return True  # Not applicable on non-Windows systems
         
         try:
@@ -1282,11 +2551,15 @@ WantedBy=multi-user.target
         except:
             return False
     
-    def _run_as_admin(self, command, parent_widget=None):
-        """Run a command with administrator privileges using UAC."""
+    def _run_as_admin(self, command: List[str], parent_widget=None, wait_timeout: Optional[float] = None):
+        """Run a command (argv list) with administrator privileges using UAC.
+        
+        With wait_timeout (seconds), block until the elevated process exits so
+        the caller can check what it did; success then also means exit code 0.
+        """
         try:
             import ctypes
-            from PyQt6.QtWidgets import QMessageBox
+            from ctypes import wintypes
             
             if parent_widget:
                 reply = QMessageBox.question(
@@ -1302,76 +2575,205 @@ WantedBy=multi-user.target
                 if reply != QMessageBox.StandardButton.Yes:
                     return False, "User declined administrator privileges"
             
-            # Use ShellExecute with 'runas' to trigger UAC prompt
-            result = ctypes.windll.shell32.ShellExecuteW(
-                None,
-                "runas",  # This triggers UAC
-                "powershell",
-                f"-Command \"{command}\"",
-                None,
-                1  # SW_SHOWNORMAL
+            class SHELLEXECUTEINFOW(ctypes.Structure):
+                _fields_ = [
+                    ("cbSize", wintypes.DWORD), ("fMask", ctypes.c_ulong), ("hwnd", wintypes.HWND),
+                    ("lpVerb", wintypes.LPCWSTR), ("lpFile", wintypes.LPCWSTR),
+                    ("lpParameters", wintypes.LPCWSTR), ("lpDirectory", wintypes.LPCWSTR),
+                    ("nShow", ctypes.c_int), ("hInstApp", wintypes.HINSTANCE), ("lpIDList", ctypes.c_void_p),
+                    ("lpClass", wintypes.LPCWSTR), ("hkeyClass", wintypes.HKEY), ("dwHotKey", wintypes.DWORD),
+                    ("hIconOrMonitor", wintypes.HANDLE), ("hProcess", wintypes.HANDLE),
+                ]
+            
+            # ShellExecuteEx with 'runas' triggers the UAC prompt; the program
+            # is launched directly, no shell in between, and we get its handle
+            info = SHELLEXECUTEINFOW(
+                cbSize=ctypes.sizeof(SHELLEXECUTEINFOW),
+                fMask=0x40,  # SEE_MASK_NOCLOSEPROCESS
+                lpVerb="runas",
+                lpFile=command[0],
+                lpParameters=subprocess.list2cmdline(command[1:]),
+                nShow=1,  # SW_SHOWNORMAL
             )
+            if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(info)):
+                # ERROR_CANCELLED (1223) means the UAC prompt was refused
+                return False, f"Failed to execute with administrator privileges (error code: {ctypes.GetLastError()})"
+            if not info.hProcess:
+                return True, "Command executed with administrator privileges"
             
-            # ShellExecute returns a value > 32 on success
-            if result > 32:
+            try:
+                if wait_timeout is None:
+                    return True, "Command executed with administrator privileges"
+                kernel32 = ctypes.windll.kernel32
+                if kernel32.WaitForSingleObject(info.hProcess, int(wait_timeout * 1000)) != 0:  # WAIT_OBJECT_0
+                    return False, "Elevated command did not finish in time"
+                exit_code = wintypes.DWORD()
+                kernel32.GetExitCodeProcess(info.hProcess, ctypes.byref(exit_code))
+                if exit_code.value != 0:
+                    return False, f"Elevated command failed (exit code: {exit_code.value})"
                 return True, "Command executed with administrator privileges"
-            else:
-                return False, f"Failed to execute with administrator privileges (error code: {result})"
+            finally:
+                ctypes.windll.kernel32.CloseHandle(info.hProcess)
                 
         except Exception as e:
             return False, f"Error requesting administrator privileges: {str(e)}"
 
+    def _startup_task_command(self, username: str, bucket_name: str, mount_point: str) -> List[str]:
+        """Write one bucket's auto-mount task definition and build the schtasks /Create argv for it."""
+        from xml.sax.saxutils import escape
+        task_name = f"HaioMount-{username}-{bucket_name}"
+        
+        # Get the current executable path
+        if hasattr(sys, '_MEIPASS'):
+            # Running as PyInstaller bundle
+            exe_path = sys.executable
+            arg_prefix = ''  # no script path needed
+        else:
+            # Running as script; use the current Python interpreter and pass the script path as first arg
+            exe_path = sys.executable
+            arg_prefix = f'\"{os.path.abspath(__file__)}\" '
+        
+        # schtasks.exe only accepts the battery/hidden settings (and arguments
+        # longer than /TR's 261 characters) through an XML definition. Use an
+        # at-logon trigger for the current user so the mount runs in the user session.
+        task_args = f'{arg_prefix}--auto-mount --username {username} --bucket {bucket_name} --mount-point "{mount_point}"'
+        current_user = escape(os.environ.get('USERNAME', ''))
+        task_xml = f"""<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <Triggers>
+    <LogonTrigger>
+      <Enabled>true</Enabled>
+      <UserId>{current_user}</UserId>
+    </LogonTrigger>
+  </Triggers>
+  <Principals>
+    <Principal id="Author">
+      <UserId>{current_user}</UserId>
+      <LogonType>InteractiveToken</LogonType>
+      <RunLevel>HighestAvailable</RunLevel>
+    </Principal>
+  </Principals>
+  <Settings>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <StartWhenAvailable>true</StartWhenAvailable>
+    <RunOnlyIfNetworkAvailable>true</RunOnlyIfNetworkAvailable>
+    <Hidden>true</Hidden>
+  </Settings>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{escape(exe_path)}</Command>
+      <Arguments>{escape(task_args)}</Arguments>
+      <WorkingDirectory>{escape(os.path.dirname(exe_path))}</WorkingDirectory>
+    </Exec>
+  </Actions>
+</Task>
+"""
+        # Callers delete the file with _discard_task_xml once schtasks has run
+        xml_path = self._task_xml_path(task_name)
+        os.makedirs(_APP_CONFIG_DIR, exist_ok=True)
+        with open(xml_path, 'w', encoding='utf-16') as f:
+            f.write(task_xml)
+        return ['schtasks', '/Create', '/TN', task_name, '/XML', xml_path, '/F']
+    
+    @staticmethod
+    def _task_xml_path(task_name: str) -> str:
+        """Where _startup_task_command writes a task's definition (the app's config dir)."""
+        return os.path.join(_APP_CONFIG_DIR, f"{task_name}.xml")
+    
+    def _discard_task_xml(self, username: str, bucket_name: str):
+        """Delete a task definition once schtasks is done with it."""
+        with contextlib.suppress(OSError):
+            os.remove(self._task_xml_path(f"HaioMount-{username}-{bucket_name}"))
+    
+    def create_windows_startup_tasks(self, username: str, specs: List[tuple], parent_widget=None) -> Dict[str, bool]:
+        """Create startup tasks for several (bucket_name, mount_point) pairs at once.
+        
+        Without admin rights all schtasks calls go into one batch file that is
+        run under a single UAC prompt. Windows only.
+        """
+        results = {bucket_name: False for bucket_name, _ in specs}
+        if not _IS_WINDOWS or not specs:
+            return results
+        
+        try:
+            self._task_names = None  # task list is about to change
+            commands = {bucket_name: self._startup_task_command(username, bucket_name, mount_point)
+                        for bucket_name, mount_point in specs}
+            
+            if self._is_admin():
+                for bucket_name, create_cmd in commands.items():
+                    try:
+                        result = self._run_hidden_subprocess(create_cmd, capture_output=True, text=True, timeout=30)
+                    finally:
+                        self._discard_task_xml(username, bucket_name)
+                    results[bucket_name] = result.returncode == 0
+                    if result.returncode != 0:
+                        print(f"Failed to create Windows startup task: {result.stderr}")
+                return results
+            
+            # Run all schtasks calls from one batch file under a single UAC prompt,
+            # and wait for it so the outcome can be read back from Task Scheduler
+            os.makedirs(_APP_CONFIG_DIR, exist_ok=True)
+            fd, script_path = tempfile.mkstemp(dir=_APP_CONFIG_DIR, prefix="create-auto-mount-tasks.", suffix=".cmd")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write("@echo off\n")
+                    for create_cmd in commands.values():
+                        f.write(subprocess.list2cmdline(create_cmd).replace('%', '%%') + "\n")
+                
+                success, message = self._run_as_admin(['cmd', '/c', script_path], parent_widget,
+                                                      wait_timeout=self.ELEVATED_TASK_TIMEOUT)
+                if not success:
+                    print(f"Failed to create Windows startup tasks: {message}")
+            finally:
+                with contextlib.suppress(OSError):
+                    os.remove(script_path)
+                for bucket_name in commands:
+                    self._discard_task_xml(username, bucket_name)
+            
+            # Report what actually exists: UAC may have been refused or a
+            # single schtasks call in the batch may have failed
+            self._task_names = None
+            existing = self._scheduled_task_names()
+            return {bucket_name: f"\\HaioMount-{username}-{bucket_name}" in existing for bucket_name in results}
+            
+        except Exception as e:
+            print(f"Error creating Windows startup tasks: {e}")
+            for bucket_name in results:
+                self._discard_task_xml(username, bucket_name)
+            return results
+    
     def create_windows_startup_task(self, username: str, bucket_name: str, mount_point: str, parent_widget=None) -> bool:
         """Create a Windows Task Scheduler task for auto-mount at startup."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return False
             
         try:
+            self._task_names = None  # task list is about to change
+            create_cmd = self._startup_task_command(username, bucket_name, mount_point)
             task_name = f"HaioMount-{username}-{bucket_name}"
             
-            # Get the current executable path
-            if hasattr(sys, '_MEIPASS'):
-                # Running as PyInstaller bundle
-                exe_path = sys.executable
-                arg_prefix = ''  # no script path needed
-            else:
-                # Running as script; use the current Python interpreter and pass the script path as first arg
-                exe_path = sys.executable
-                arg_prefix = f'\"{os.path.abspath(__file__)}\" '
-            
-            # Create PowerShell command to create scheduled task
-            # Use AtLogOn trigger for the current user so the mount runs in the user session, with a short delay.
-            ps_command = f"""
-            $exe = '{exe_path}'
-            $wd = Split-Path -Parent $exe
-            $args = '{arg_prefix}--auto-mount --username {username} --bucket {bucket_name} --mount-point \"{mount_point}\"'
-            $Action = New-ScheduledTaskAction -Execute $exe -Argument $args -WorkingDirectory $wd
-            $Trigger = New-ScheduledTaskTrigger -AtLogOn -User $env:USERNAME
-            $Principal = New-ScheduledTaskPrincipal -UserId $env:USERNAME -LogonType Interactive -RunLevel Highest
-            $Settings = New-ScheduledTaskSettingsSet -AllowStartIfOnBatteries -DontStopIfGoingOnBatteries -StartWhenAvailable -RunOnlyIfNetworkAvailable -Hidden
-            Register-ScheduledTask -TaskName '{task_name}' -Action $Action -Trigger $Trigger -Principal $Principal -Settings $Settings -Force
-            """.strip()
-            
             # Check if we're running as admin
             if not self._is_admin():
-                # Request admin privileges
-                success, message = self._run_as_admin(ps_command, parent_widget)
-                if success:
-                    # Since we can't directly get the result from the elevated process,
-                    # we'll assume success and let the user know to check
+                # Request admin privileges and wait, so the result can be checked
+                try:
+                    success, message = self._run_as_admin(create_cmd, parent_widget,
+                                                          wait_timeout=self.ELEVATED_TASK_TIMEOUT)
+                finally:
+                    self._discard_task_xml(username, bucket_name)
+                self._task_names = None
+                if f"\\{task_name}" in self._scheduled_task_names():
                     if parent_widget:
-                        from PyQt6.QtWidgets import QMessageBox
                         QMessageBox.information(
                             parent_widget, 
-                            "Auto-mount Task", 
-                            f"Admin command executed for creating auto-mount task for '{bucket_name}'.\n\n"
-                            f"If the UAC prompt was accepted, the task should now be created.\n"
-                            f"You can verify this in Task Scheduler under 'HaioMount-{username}-{bucket_name}'."
+                            "Auto-mount Enabled", 
+                            f"Auto-mount task created successfully for '{bucket_name}'.\n"
+                            f"The bucket will be mounted automatically when you log in."
                         )
                     return True
                 else:
                     if parent_widget:
-                        from PyQt6.QtWidgets import QMessageBox
                         QMessageBox.warning(
                             parent_widget,
                             "Failed to Create Auto-mount Task",
@@ -1381,12 +2783,13 @@ WantedBy=multi-user.target
                     return False
             else:
                 # We're already running as admin, execute directly
-                result = subprocess.run(['powershell', '-Command', ps_command], 
-                                      capture_output=True, text=True, timeout=30)
+                try:
+                    result = self._run_hidden_subprocess(create_cmd, capture_output=True, text=True, timeout=30)
+                finally:
+                    self._discard_task_xml(username, bucket_name)
                 
                 if result.returncode == 0:
                     if parent_widget:
-                        from PyQt6.QtWidgets import QMessageBox
                         QMessageBox.information(
                             parent_widget, 
                             "Auto-mount Enabled", 
@@ -1397,7 +2800,6 @@ WantedBy=multi-user.target
                 else:
                     print(f"Failed to create Windows startup task: {result.stderr}")
                     if parent_widget:
-                        from PyQt6.QtWidgets import QMessageBox
                         QMessageBox.warning(
                             parent_widget,
                             "Failed to Create Auto-mount Task",
@@ -1411,25 +2813,26 @@ WantedBy=multi-user.target
     
     def remove_windows_startup_task(self, username: str, bucket_name: str, parent_widget=None) -> bool:
         """Remove Windows Task Scheduler task for auto-mount."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return True
             
         try:
             task_name = f"HaioMount-{username}-{bucket_name}"
+            self._task_names = None  # task list is about to change
+            self._discard_task_xml(username, bucket_name)  # in case a create was cut short
             
             # Check if we're running as admin for removal (usually doesn't need admin but just in case)
             if not self._is_admin():
                 # Try without admin first
-                result = subprocess.run(['schtasks', '/Delete', '/TN', task_name, '/F'], 
-                                      capture_output=True, text=True, timeout=10)
+                result = self._run_hidden_subprocess(['schtasks', '/Delete', '/TN', task_name, '/F'], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10)
                 
                 if result.returncode != 0 and "access is denied" in result.stderr.lower():
                     # If access denied, try with admin privileges
-                    command = f"schtasks /Delete /TN {task_name} /F"
+                    command = ['schtasks', '/Delete', '/TN', task_name, '/F']
                     success, message = self._run_as_admin(command, parent_widget)
                     if success:
                         if parent_widget:
-                            from PyQt6.QtWidgets import QMessageBox
                             QMessageBox.information(
                                 parent_widget, 
                                 "Auto-mount Disabled", 
@@ -1440,12 +2843,11 @@ WantedBy=multi-user.target
                         return False
             else:
                 # We're already admin or it's the first try
-                result = subprocess.run(['schtasks', '/Delete', '/TN', task_name, '/F'], 
-                                      capture_output=True, text=True, timeout=10)
+                result = self._run_hidden_subprocess(['schtasks', '/Delete', '/TN', task_name, '/F'], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=10)
             
             if result.returncode == 0:
                 if parent_widget:
-                    from PyQt6.QtWidgets import QMessageBox
                     QMessageBox.information(
                         parent_widget, 
                         "Auto-mount Disabled", 
@@ -1466,75 +2868,133 @@ WantedBy=multi-user.target
     
     def is_windows_startup_task_enabled(self, username: str, bucket_name: str) -> bool:
         """Check if Windows Task Scheduler task exists for auto-mount."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             return False
             
         try:
             task_name = f"HaioMount-{username}-{bucket_name}"
-            
-            # Check if task exists
-            result = subprocess.run(['schtasks', '/Query', '/TN', task_name], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
+            # Our tasks are registered in the root folder
+            return f"\\{task_name}" in self._scheduled_task_names()
             
         except Exception as e:
             print(f"Error checking Windows startup task: {e}")
             return False
+    
+    def _scheduled_task_names(self) -> set:
+        """Return the full paths of all scheduled tasks, from one recent schtasks query."""
+        import csv
+        now = time.monotonic()
+        if self._task_names and now - self._task_names[0] < self.SERVICE_STATE_TTL:
+            return self._task_names[1]
+        
+        result = self._run_hidden_subprocess(['schtasks', '/Query', '/FO', 'CSV', '/NH'],
+                                capture_output=True, text=True, timeout=10)
+        names = set()
+        for row in csv.reader(result.stdout.splitlines()):
+            # First column is the full task path, e.g. "\HaioMount-user-bucket"
+            if row:
+                names.add(row[0])
+        self._task_names = (now, names)
+        return names
 
     def create_auto_mount_service(self, username: str, bucket_name: str, mount_point: str, parent_widget=None) -> bool:
         """Create auto-mount service for the current platform."""
-        if platform.system() == "Linux":
-            return self.create_systemd_service(username, bucket_name, mount_point, parent_widget)
-        elif platform.system() == "Windows":
-            return self.create_windows_startup_task(username, bucket_name, mount_point, parent_widget)
+        created = self._auto_ops['create'](username, bucket_name, mount_point, parent_widget)
+        
+        # A failed attempt may have left things half-done, so re-query next time
+        if created:
+            self._auto_mount_cache[(username, bucket_name)] = True
         else:
-            if parent_widget:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.information(parent_widget, "Not Supported", 
-                                      "Auto-mount at boot is not supported on this operating system.")
-            return False
+            self._auto_mount_cache.pop((username, bucket_name), None)
+        return created
+    
+    def create_auto_mount_services(self, username: str, specs: List[tuple], parent_widget=None) -> Dict[str, bool]:
+        """Create auto-mount services for several (bucket_name, mount_point) pairs with one
+        reload/elevation; returns {bucket_name: created}."""
+        results = self._auto_ops['create_many'](username, specs, parent_widget)
+        
+        for bucket_name, created in results.items():
+            if created:
+                self._auto_mount_cache[(username, bucket_name)] = True
+            else:
+                self._auto_mount_cache.pop((username, bucket_name), None)
+        return results
     
     def remove_auto_mount_service(self, username: str, bucket_name: str, parent_widget=None) -> bool:
         """Remove auto-mount service for the current platform."""
-        if platform.system() == "Linux":
-            return self.remove_systemd_service(username, bucket_name, parent_widget)
-        elif platform.system() == "Windows":
-            return self.remove_windows_startup_task(username, bucket_name, parent_widget)
+        removed = self._auto_ops['remove'](username, bucket_name, parent_widget)
+        
+        if removed:
+            self._auto_mount_cache[(username, bucket_name)] = False
         else:
-            return True
+            self._auto_mount_cache.pop((username, bucket_name), None)
+        return removed
     
     def is_auto_mount_service_enabled(self, username: str, bucket_name: str) -> bool:
         """Check if auto-mount service is enabled for the current platform."""
-        if platform.system() == "Linux":
-            return self.is_systemd_service_enabled(username, bucket_name)
-        elif platform.system() == "Windows":
-            return self.is_windows_startup_task_enabled(username, bucket_name)
-        else:
-            return False
+        key = (username, bucket_name)
+        if key in self._auto_mount_cache:
+            return self._auto_mount_cache[key]
+        
+        enabled = self._auto_ops['enabled'](username, bucket_name)
+        self._auto_mount_cache[key] = enabled
+        return enabled
+    
+    def _auto_mount_unsupported(self, username: str, bucket_name: str, mount_point: str, parent_widget=None) -> bool:
+        """Auto-mount backend for platforms without one."""
+        if parent_widget:
+            QMessageBox.information(parent_widget, "Not Supported", 
+                                  "Auto-mount at boot is not supported on this operating system.")
+        return False
+    
+    def known_auto_mount_state(self, username: str, bucket_name: str) -> Optional[bool]:
+        """Return the cached auto-mount state without querying the system, or None if unknown."""
+        return self._auto_mount_cache.get((username, bucket_name))
 
 class TokenManager:
     """Manages authentication tokens persistently."""
     
     def __init__(self):
-        self.config_dir = os.path.expanduser("~/.config/haio-client")
+        self.config_dir = _APP_CONFIG_DIR
         self.token_file = os.path.join(self.config_dir, "tokens.json")
         os.makedirs(self.config_dir, exist_ok=True)
+        # Read once; every later lookup and update works on this copy
+        self._data: Dict[str, Dict] = self._read_tokens()
     
-    def save_token(self, username: str, token: str):
-        """Save authentication token (no password)."""
+    def _read_tokens(self) -> Dict[str, Dict]:
+        """Read the token file, returning an empty mapping if it's missing or unreadable."""
         try:
-            data = {}
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'r') as f:
-                    data = json.load(f)
-            
-            data[username] = {
+            with open(self.token_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading tokens: {e}")
+            return {}
+    
+    def _write_tokens(self):
+        """Atomically replace the token file with the in-memory data."""
+        fd, temp_path = tempfile.mkstemp(dir=self.config_dir, prefix=".tokens.json.")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._data, f, separators=(",", ":"))
+            os.replace(temp_path, self.token_file)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def save_token(self, username: str, token: str, password: Optional[str] = None):
+        """Save authentication token, and the password too if given, in a single write."""
+        try:
+            entry = {
                 'token': token,
                 'timestamp': time.time()
             }
-            
-            with open(self.token_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if password is not None:
+                entry['password_enc'] = self._encode_password(password)
+            self._data[username] = entry
+            self._write_tokens()
                 
         except Exception as e:
             print(f"Error saving token: {e}")
@@ -1542,33 +3002,47 @@ class TokenManager:
     def load_token(self, username: str) -> Optional[Dict]:
         """Load saved token data."""
         try:
-            if not os.path.exists(self.token_file):
-                return None
-            
-            with open(self.token_file, 'r') as f:
-                data = json.load(f)
-            
             # Backward-compatibility migration: if plaintext password exists, encrypt it and rewrite
-            entry = data.get(username)
-            if entry and 'password' in entry and 'password_enc' not in entry and platform.system() == 'Windows':
+            entry = self._data.get(username)
+            if entry and 'password' in entry and 'password_enc' not in entry and _IS_WINDOWS:
                 try:
                     enc = self._win_encrypt(entry['password'])
                     entry['password_enc'] = enc
                     del entry['password']
-                    with open(self.token_file, 'w') as fw:
-                        json.dump(data, fw, indent=2)
+                    self._write_tokens()
                 except Exception as e:
                     print(f"Warning: failed to migrate plaintext password: {e}")
 
-            return data.get(username)
+            return entry
             
         except Exception as e:
             print(f"Error loading token: {e}")
             return None
     
+    def saved_usernames(self) -> List[str]:
+        """Return users with saved data, oldest first."""
+        return list(self._data)
+    
+    def clear_password(self, username: str):
+        """Forget the stored password for a user but keep the rest of their entry."""
+        entry = self._data.get(username)
+        if entry and ('password_enc' in entry or 'password' in entry):
+            entry.pop('password_enc', None)
+            entry.pop('password', None)
+            self._write_tokens()
+    
+    def remove_user(self, username: str) -> bool:
+        """Forget everything saved for a user. Returns True if there was anything to remove."""
+        if username not in self._data:
+            return False
+        del self._data[username]
+        self._write_tokens()
+        return True
+    
     def clear_tokens(self):
         """Clear all saved tokens."""
         try:
+            self._data = {}
             if os.path.exists(self.token_file):
                 os.remove(self.token_file)
         except Exception as e:
@@ -1582,47 +3056,33 @@ class TokenManager:
         On other OS, stores plaintext as a minimal fallback (can be improved with keyring later).
         """
         try:
-            data = {}
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'r') as f:
-                    data = json.load(f)
-            if username not in data:
-                data[username] = {'timestamp': time.time()}
-
-            if platform.system() == 'Windows':
-                enc = self._win_encrypt(password)
-                data[username]['password_enc'] = enc
-                # remove any legacy plaintext
-                if 'password' in data[username]:
-                    del data[username]['password']
-            else:
-                # Use base64 encoding for Linux/Mac (simple obfuscation)
-                # Not as secure as Windows DPAPI but better than plaintext
-                import base64
-                enc_password = base64.b64encode(password.encode('utf-8')).decode('ascii')
-                data[username]['password_enc'] = enc_password
-                # remove any legacy plaintext
-                if 'password' in data[username]:
-                    del data[username]['password']
-
-            with open(self.token_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            entry = self._data.setdefault(username, {'timestamp': time.time()})
+            entry['password_enc'] = self._encode_password(password)
+            # remove any legacy plaintext
+            entry.pop('password', None)
+
+            self._write_tokens()
             return True
         except Exception as e:
             print(f"Error saving password: {e}")
             return False
 
+    def _encode_password(self, password: str) -> str:
+        """Encode a password for storage (DPAPI on Windows, base64 elsewhere)."""
+        if _IS_WINDOWS:
+            return self._win_encrypt(password)
+        # Use base64 encoding for Linux/Mac (simple obfuscation)
+        # Not as secure as Windows DPAPI but better than plaintext
+        import base64
+        return base64.b64encode(password.encode('utf-8')).decode('ascii')
+
     def get_password(self, username: str) -> Optional[str]:
         """Retrieve the stored password for the user, if available."""
         try:
-            if not os.path.exists(self.token_file):
-                return None
-            with open(self.token_file, 'r') as f:
-                data = json.load(f)
-            entry = data.get(username)
+            entry = self._data.get(username)
             if not entry:
                 return None
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 if 'password_enc' in entry:
                     return self._win_decrypt(entry['password_enc'])
                 return entry.get('password')
@@ -1727,6 +3187,95 @@ class BucketWorker(QThread):
             self.finished.emit([])
 
 
+class DependencyWorker(QThread):
+    """Worker thread for checking rclone/FUSE/WinFsp availability."""
+    finished = pyqtSignal(list)  # issues list
+    
+    def __init__(self, rclone_manager):
+        super().__init__()
+        self.rclone_manager = rclone_manager
+    
+    def run(self):
+        """Run dependency checks in thread."""
+        try:
+            issues = self.rclone_manager.check_dependencies()
+            self.finished.emit(issues)
+        except Exception as e:
+            print(f"Error checking dependencies: {e}")
+            self.finished.emit([])
+
+
+class AutoMountProbeWorker(QThread):
+    """Worker thread for checking auto-mount state of several buckets."""
+    finished = pyqtSignal(dict)  # {bucket_name: enabled}
+    
+    def __init__(self, rclone_manager, username, bucket_names):
+        super().__init__()
+        self.rclone_manager = rclone_manager
+        self.username = username
+        self.bucket_names = bucket_names
+    
+    def run(self):
+        """Query auto-mount state in thread."""
+        states = {}
+        try:
+            for bucket_name in self.bucket_names:
+                if self.isInterruptionRequested():
+                    break
+                states[bucket_name] = self.rclone_manager.is_auto_mount_service_enabled(
+                    self.username, bucket_name)
+        except Exception as e:
+            print(f"Error checking auto-mount state: {e}")
+        self.finished.emit(states)
+
+
+class AutoMountSetupWorker(QThread):
+    """Worker thread for enabling/disabling auto-mount at boot."""
+    finished = pyqtSignal(bool, str)  # success, message
+    
+    def __init__(self, rclone_manager, operation: str, username: str, bucket_name: str,
+                 mount_point: Optional[str] = None):
+        super().__init__()
+        self.rclone_manager = rclone_manager
+        self.operation = operation
+        self.username = username
+        self.bucket_name = bucket_name
+        self.mount_point = mount_point
+    
+    def run(self):
+        """Create or remove the auto-mount service in thread (no dialogs from here)."""
+        try:
+            if self.operation == 'enable':
+                success = self.rclone_manager.create_auto_mount_service(
+                    self.username, self.bucket_name, self.mount_point)
+            else:
+                success = self.rclone_manager.remove_auto_mount_service(
+                    self.username, self.bucket_name)
+            self.finished.emit(success, "")
+        except Exception as e:
+            self.finished.emit(False, f"Error: {str(e)}")
+
+
+class AutoMountBatchWorker(QThread):
+    """Worker thread for enabling auto-mount for several buckets in one go."""
+    finished = pyqtSignal(dict)  # {bucket_name: success}
+    
+    def __init__(self, rclone_manager, username: str, specs: List[tuple]):
+        super().__init__()
+        self.rclone_manager = rclone_manager
+        self.username = username
+        self.specs = specs
+    
+    def run(self):
+        """Create the auto-mount services in thread (no dialogs from here)."""
+        try:
+            results = self.rclone_manager.create_auto_mount_services(self.username, self.specs)
+        except Exception as e:
+            print(f"Error enabling auto-mount: {e}")
+            results = {bucket_name: False for bucket_name, _ in self.specs}
+        self.finished.emit(results)
+
+
 class MountWorker(QThread):
     """Worker thread for mount/unmount operations."""
     
@@ -1749,9 +3298,12 @@ class MountWorker(QThread):
                 success = False
                 message = "Unknown operation"
             
+            # The mount table just changed; don't let widgets read a stale snapshot
+            self.rclone_manager.invalidate_mount_snapshot()
             self.finished.emit(success, message)
             
         except Exception as e:
+            self.rclone_manager.invalidate_mount_snapshot()
             self.finished.emit(False, f"Error: {str(e)}")
 
 
@@ -1762,13 +3314,15 @@ class BucketWidget(QFrame):
     unmount_requested = pyqtSignal(str)     # mount_point
     auto_mount_changed = pyqtSignal(str, bool)  # bucket_name, enabled
     
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+    
     def __init__(self, bucket_info: Dict, username: str, rclone_manager: RcloneManager):
         super().__init__()
         self.bucket_info = bucket_info
         self.username = username
         self.rclone_manager = rclone_manager
         # Use user's home directory on Linux, drive letters on Windows
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # Try to detect if this bucket is already mounted on any drive
             detected_drive = self._find_existing_bucket_drive(bucket_info['name'], username)
             if detected_drive:
@@ -1785,12 +3339,10 @@ class BucketWidget(QFrame):
                     drive_letter = available_drives[drive_index]
                     self.mount_point = f"{drive_letter}:"
                 else:
-                    user_home = os.path.expanduser("~")
-                    self.mount_point = os.path.join(user_home, f"haio-{username}-{bucket_info['name']}")
+                    self.mount_point = _home_mount_prefix(username) + bucket_info['name']
         else:
             # Linux/Unix - use user's home directory to avoid permission issues
-            user_home = os.path.expanduser("~")
-            self.mount_point = os.path.join(user_home, f"haio-{username}-{bucket_info['name']}")
+            self.mount_point = _home_mount_prefix(username) + bucket_info['name']
         self.is_mounted = False
         
         self.setup_ui()
@@ -1845,11 +3397,10 @@ class BucketWidget(QFrame):
         """Check if a specific bucket is mounted on the given drive by analyzing rclone processes."""
         try:
             # Only check if we can find a running rclone process specifically for this bucket and drive
-            import subprocess
             
             # Method 1: Use tasklist to get detailed process info
             try:
-                result = subprocess.run(['wmic', 'process', 'where', 'name="rclone.exe"', 
+                result = self.rclone_manager._run_hidden_subprocess(['wmic', 'process', 'where', 'name="rclone.exe"', 
                                        'get', 'processid,commandline'], 
                                       capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
@@ -1898,30 +3449,23 @@ class BucketWidget(QFrame):
 
         # Fallback 1: PowerShell (can be slow or unavailable on some SKUs)
         try:
-            import subprocess
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-NonInteractive', '-Command',
-                 f'$v = Get-Volume -ErrorAction SilentlyContinue -DriveLetter {drive_letter}; if ($v) {{ $v.FileSystemLabel }}'],
-                capture_output=True, text=True, timeout=3
-            )
-            if result.returncode == 0:
-                volume_label = result.stdout.strip()
-                if volume_label:
-                    print(f"    PowerShell volume label for {drive_letter}: '{volume_label}'")
-                    if expected_label.strip().lower() == volume_label.strip().lower():
-                        print(f"    Volume label match found for {drive_letter}! (PowerShell)")
-                        return True
-                else:
-                    print(f"    PowerShell returned empty label for {drive_letter}")
+            volume_label = self.rclone_manager._ps_run(
+                f'$v = Get-Volume -ErrorAction SilentlyContinue -DriveLetter {drive_letter}; if ($v) {{ $v.FileSystemLabel }}',
+                timeout=3
+            ).strip()
+            if volume_label:
+                print(f"    PowerShell volume label for {drive_letter}: '{volume_label}'")
+                if expected_label.strip().lower() == volume_label.strip().lower():
+                    print(f"    Volume label match found for {drive_letter}! (PowerShell)")
+                    return True
             else:
-                print(f"    PowerShell volume check failed for {drive_letter}: {result.stderr.strip()}")
+                print(f"    PowerShell returned empty label for {drive_letter}")
         except Exception as e:
             print(f"    PowerShell volume check error for {drive_letter}: {e}")
         
         # Fallback 2: legacy 'vol' command
         try:
-            import subprocess
-            result = subprocess.run(['vol', f'{drive_letter}:'], 
+            result = self.rclone_manager._run_hidden_subprocess(['vol', f'{drive_letter}:'], 
                                   capture_output=True, text=True, timeout=3)
             if result.returncode == 0:
                 output = result.stdout.strip()
@@ -1991,30 +3535,26 @@ class BucketWidget(QFrame):
     def _is_rclone_mount(self, drive_letter: str, bucket_name: str) -> bool:
         """Check if a drive letter is an rclone mount for the specific bucket."""
         try:
-            import subprocess
             # Use PowerShell to get process command lines more reliably
-            result = subprocess.run(['powershell', '-Command', 
-                                   'Get-WmiObject Win32_Process -Filter "name=\'rclone.exe\'" | Select-Object CommandLine'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                output = result.stdout
-                print(f"    Rclone process check for {drive_letter}: searching for ':{bucket_name}' and '{drive_letter}:'")
-                # Look for a process mounting this bucket to this drive letter
-                for line in output.split('\n'):
-                    if (f':{bucket_name}' in line and 
-                        f'{drive_letter}:' in line and 
-                        'mount' in line):
-                        print(f"    Found matching rclone process for {drive_letter}!")
-                        return True
-                print(f"    No matching rclone process found for {drive_letter}")
-            else:
-                print(f"    PowerShell process check failed for {drive_letter}: {result.stderr}")
+            # (-ExpandProperty so long command lines aren't cut to table width)
+            output = self.rclone_manager._ps_run(
+                'Get-WmiObject Win32_Process -Filter "name=\'rclone.exe\'" | Select-Object -ExpandProperty CommandLine',
+                timeout=5)
+            print(f"    Rclone process check for {drive_letter}: searching for ':{bucket_name}' and '{drive_letter}:'")
+            # Look for a process mounting this bucket to this drive letter
+            for line in output.split('\n'):
+                if (f':{bucket_name}' in line and 
+                    f'{drive_letter}:' in line and 
+                    'mount' in line):
+                    print(f"    Found matching rclone process for {drive_letter}!")
+                    return True
+            print(f"    No matching rclone process found for {drive_letter}")
         except Exception as e:
             print(f"    PowerShell process check error for {drive_letter}: {e}")
         
         # Fallback: try wmic
         try:
-            result = subprocess.run(['wmic', 'process', 'where', 'name="rclone.exe"', 
+            result = self.rclone_manager._run_hidden_subprocess(['wmic', 'process', 'where', 'name="rclone.exe"', 
                                    'get', 'commandline'], 
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
@@ -2066,18 +3606,7 @@ class BucketWidget(QFrame):
         theme = ThemeManager()
         c = theme.get_colors()
         
-        self.setStyleSheet(f"""
-            BucketWidget {{
-                border: 2px solid {c['border']};
-                border-radius: 12px;
-                background-color: {c['bg_widget']};
-                margin: 5px;
-            }}
-            BucketWidget:hover {{
-                border-color: {c['primary']};
-                background-color: {c['bg_alt']};
-            }}
-        """)
+        self.setStyleSheet(_themed_qss(_BUCKET_FRAME_QSS, c))
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -2088,19 +3617,20 @@ class BucketWidget(QFrame):
         
         # Bucket name
         name_label = QLabel(self.bucket_info['name'])
-        name_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        name_label.setFont(_bucket_name_font())
         name_label.setStyleSheet(f"color: {c['text']}; margin-bottom: 5px;")
         
         # Size info
-        size_text = self.format_size(self.bucket_info.get('bytes', 0))
-        count_text = f"{self.bucket_info.get('count', 0)} objects"
+        self._stats = (self.bucket_info.get('count', 0), self.bucket_info.get('bytes', 0))
+        size_text = self.format_size(self._stats[1])
+        count_text = f"{self._stats[0]} objects"
         
-        info_label = QLabel(f"{size_text} • {count_text}")
-        info_label.setStyleSheet(f"color: {c['text_secondary']}; font-size: 12px;")
+        self.info_label = QLabel(f"{size_text} • {count_text}")
+        self.info_label.setStyleSheet(f"color: {c['text_secondary']}; font-size: 12px;")
         
         header_layout.addWidget(name_label)
         header_layout.addStretch()
-        header_layout.addWidget(info_label)
+        header_layout.addWidget(self.info_label)
         
         layout.addLayout(header_layout)
         
@@ -2114,86 +3644,28 @@ class BucketWidget(QFrame):
         
         # Mount status
         self.status_label = QLabel("Not mounted")
-        self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        self.status_label.setStyleSheet(_STATUS_UNMOUNTED_QSS)
         
         # Mount/Unmount button
         self.mount_btn = QPushButton("Mount")
-        self.mount_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.mount_btn.setStyleSheet(_MOUNT_BTN_QSS)
         self.mount_btn.clicked.connect(self.toggle_mount)
         
         # Auto-mount checkbox with theme-aware styling
         self.auto_mount_cb = QCheckBox("Auto-mount at boot")
+        self.auto_mount_cb.setStyleSheet(_themed_qss(_AUTO_MOUNT_CB_QSS, c))
         
-        # Get theme colors for proper visibility in dark/light mode
-        theme = ThemeManager()
-        c = theme.get_colors()
-        
-        self.auto_mount_cb.setStyleSheet(f"""
-            QCheckBox {{
-                color: {c['text']};
-                font-size: 13px;
-                font-weight: 500;
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {c['border']};
-                border-radius: 4px;
-                background-color: {c['bg_widget']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {c['primary']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {c['primary']};
-                border-color: {c['primary']};
-                image: none;
-            }}
-        """)
-        
-        # Check current auto-mount status and set checkbox state
-        is_auto_mount_enabled = self.rclone_manager.is_auto_mount_service_enabled(
+        # Use the auto-mount state if already known; otherwise the client
+        # probes it in the background and calls set_auto_mount_enabled
+        is_auto_mount_enabled = self.rclone_manager.known_auto_mount_state(
             self.username, self.bucket_info['name'])
-        self.auto_mount_cb.setChecked(is_auto_mount_enabled)
+        self.auto_mount_cb.setChecked(bool(is_auto_mount_enabled))
         
         self.auto_mount_cb.toggled.connect(self.on_auto_mount_changed)
         
         # AI Chat button - Using better icon alternatives
         self.ai_chat_btn = QPushButton("✨ AI Chat")
-        self.ai_chat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                margin-left: 5px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-            QPushButton:pressed {
-                background-color: #7d3c98;
-            }
-        """)
+        self.ai_chat_btn.setStyleSheet(_AI_CHAT_BTN_QSS)
         self.ai_chat_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.ai_chat_btn.setToolTip("AI-powered chat with your data (Coming Soon)")
         self.ai_chat_btn.clicked.connect(self.show_ai_feature_dialog)
@@ -2201,24 +3673,7 @@ class BucketWidget(QFrame):
         # Browse & Share button (if TempURL feature is available)
         if TEMPURL_AVAILABLE:
             self.browse_share_btn = QPushButton("� Browse & Share")
-            self.browse_share_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e67e22;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    margin-left: 5px;
-                    font-size: 13px;
-                }
-                QPushButton:hover {
-                    background-color: #d35400;
-                }
-                QPushButton:pressed {
-                    background-color: #ba4a00;
-                }
-            """)
+            self.browse_share_btn.setStyleSheet(_BROWSE_SHARE_BTN_QSS)
             self.browse_share_btn.setCursor(Qt.CursorShape.PointingHandCursor)
             self.browse_share_btn.setToolTip("Browse bucket contents and share files via temporary URLs")
             self.browse_share_btn.clicked.connect(self.show_bucket_browser)
@@ -2235,70 +3690,36 @@ class BucketWidget(QFrame):
     
     def format_size(self, bytes_size: int) -> str:
         """Format bytes to human readable size."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
+        bytes_size = int(bytes_size)
+        if bytes_size <= 0:
+            return "0.0 B"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        index = min((bytes_size.bit_length() - 1) // 10, len(self.SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (10 * index)):.1f} {self.SIZE_UNITS[index]}"
     
     def update_stats(self, objects_count: int, size_bytes: int):
-        """Update bucket statistics display."""
-        try:
-            # Find and update the info label
-            for i in range(self.layout().count()):
-                item = self.layout().itemAt(i)
-                if item and item.layout():
-                    # Check if this is the header layout
-                    header_layout = item.layout()
-                    for j in range(header_layout.count()):
-                        widget = header_layout.itemAt(j).widget()
-                        if isinstance(widget, QLabel) and ('objects' in widget.text() or '•' in widget.text()):
-                            # Update this label
-                            size_text = self.format_size(size_bytes)
-                            count_text = f"{objects_count} objects"
-                            widget.setText(f"{size_text} • {count_text}")
-                            break
-        except Exception as e:
-            print(f"Error updating stats for {self.bucket_info['name']}: {e}")
+        """Update bucket statistics display (no-op if the stats haven't changed)."""
+        if (objects_count, size_bytes) == self._stats:
+            return
+        self._stats = (objects_count, size_bytes)
+        size_text = self.format_size(size_bytes)
+        count_text = f"{objects_count} objects"
+        self.info_label.setText(f"{size_text} • {count_text}")
     
     def update_mount_status(self):
         """Update the mount status display."""
-        self.is_mounted = self.rclone_manager.is_mounted(self.mount_point)
+        self.is_mounted = self.rclone_manager.is_mounted_cached(self.mount_point)
         
         if self.is_mounted:
             self.status_label.setText("✓ Mounted")
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self.status_label.setStyleSheet(_STATUS_MOUNTED_QSS)
             self.mount_btn.setText("Unmount")
-            self.mount_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
+            self.mount_btn.setStyleSheet(_UNMOUNT_BTN_QSS)
         else:
             self.status_label.setText("Not mounted")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            self.status_label.setStyleSheet(_STATUS_UNMOUNTED_QSS)
             self.mount_btn.setText("Mount")
-            self.mount_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
+            self.mount_btn.setStyleSheet(_MOUNT_BTN_QSS)
     
     def toggle_mount(self):
         """Toggle mount status."""
@@ -2311,9 +3732,14 @@ class BucketWidget(QFrame):
         """Handle auto-mount checkbox change."""
         self.auto_mount_changed.emit(self.bucket_info['name'], checked)
     
+    def set_auto_mount_enabled(self, enabled: bool):
+        """Reflect the auto-mount state in the checkbox without triggering a change."""
+        self.auto_mount_cb.blockSignals(True)
+        self.auto_mount_cb.setChecked(enabled)
+        self.auto_mount_cb.blockSignals(False)
+    
     def show_ai_feature_dialog(self):
         """Show AI feature coming soon dialog in Persian and English."""
-        from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QTextEdit
         
         # Create a custom dialog
         dialog = QDialog(self)
@@ -2557,28 +3983,24 @@ class LoginDialog(QDialog):
         # Try to load saved credentials
         if self.parent_window and hasattr(self.parent_window, 'token_manager'):
             try:
-                token_file = os.path.join(self.parent_window.token_manager.config_dir, "tokens.json")
+                saved_users = self.parent_window.token_manager.saved_usernames()
                 
-                if os.path.exists(token_file):
-                    with open(token_file, 'r') as f:
-                        data = json.load(f)
+                # Pre-fill the most recent user (the last one saved)
+                if saved_users:
+                    last_user = saved_users[-1]
                     
-                    # Find the most recent user (the last one in the dict)
-                    if data:
-                        last_user = list(data.keys())[-1]
-                        
-                        # Pre-fill username
-                        self.username_input.setText(last_user)
-                        
-                        # Check if password is saved for this user
-                        password = self.parent_window.token_manager.get_password(last_user)
-                        if password:
-                            # Password is saved, check remember me
-                            self.remember_cb.setChecked(True)
-                            # Also pre-fill password for convenience
-                            self.password_input.setText(password)
-                        else:
-                            self.remember_cb.setChecked(False)
+                    # Pre-fill username
+                    self.username_input.setText(last_user)
+                    
+                    # Check if password is saved for this user
+                    password = self.parent_window.token_manager.get_password(last_user)
+                    if password:
+                        # Password is saved, check remember me
+                        self.remember_cb.setChecked(True)
+                        # Also pre-fill password for convenience
+                        self.password_input.setText(password)
+                    else:
+                        self.remember_cb.setChecked(False)
             except Exception as e:
                 print(f"Error loading saved credentials: {e}")
     
@@ -2600,36 +4022,13 @@ class LoginDialog(QDialog):
         
         # Load and display the logo (SVG preferred for transparent background)
         logo_label = QLabel()
-        svg_path = os.path.join(os.path.dirname(__file__), "haio-logo.svg")
-        png_path = os.path.join(os.path.dirname(__file__), "haio-logo.png")
-        
-        logo_loaded = False
-        
-        # Try SVG first
-        if os.path.exists(svg_path):
-            pixmap = QPixmap(svg_path)
-            if not pixmap.isNull():
-                # Scale the SVG logo to appropriate size
-                scaled_pixmap = pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, 
-                                            Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                logo_label.setStyleSheet("background: transparent; border: none;")
-                logo_loaded = True
-        
-        # Fallback to PNG
-        if not logo_loaded and os.path.exists(png_path):
-            pixmap = QPixmap(png_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, 
-                                            Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                logo_label.setStyleSheet("background: transparent; border: none;")
-                logo_loaded = True
-        
-        # Final fallback to cloud emoji
-        if not logo_loaded:
+        scaled_pixmap = _logo_pixmap(60)
+        if scaled_pixmap is not None:
+            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            logo_label.setStyleSheet("background: transparent; border: none;")
+        else:
+            # Final fallback to cloud emoji
             logo_label.setText("☁")
             logo_label.setStyleSheet("font-size: 42px; background: transparent; color: #3498db;")
             logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -2772,17 +4171,22 @@ class LoginDialog(QDialog):
         # Show loading state
         self.set_loading_state(True)
         
-        # Start authentication in background thread
-        if self.parent_window and hasattr(self.parent_window, 'api_client'):
-            self.auth_worker = AuthWorker(self.parent_window.api_client, username, password)
+        # Start authentication in background thread, reusing one worker
+        # (and its API client session) across retries
+        if self.auth_worker is None:
+            if self.parent_window and hasattr(self.parent_window, 'api_client'):
+                api_client = self.parent_window.api_client
+            else:
+                # Fallback: create temporary API client
+                api_client = ApiClient()
+            self.auth_worker = AuthWorker(api_client, username, password)
             self.auth_worker.finished.connect(self.on_auth_finished)
-            self.auth_worker.start()
         else:
-            # Fallback: create temporary API client
-            temp_api_client = ApiClient()
-            self.auth_worker = AuthWorker(temp_api_client, username, password)
-            self.auth_worker.finished.connect(self.on_auth_finished)
-            self.auth_worker.start()
+            # finished is emitted from run(), so make sure the last attempt has returned
+            self.auth_worker.wait()
+            self.auth_worker.username = username
+            self.auth_worker.password = password
+        self.auth_worker.start()
     
     def on_auth_finished(self, success: bool, username: str):
         """Handle authentication completion."""
@@ -2812,182 +4216,21 @@ class LoginDialog(QDialog):
             self.password_input.setEnabled(True)
             self.remember_cb.setEnabled(True)
     
-    def show_error(self, message: str):
-        """Show error message in the dialog."""
-        self.error_label.setText(message)
-        self.error_label.show()
-        
-        # Briefly highlight the error with animation
-        self.error_label.setStyleSheet("""
-            QLabel#errorLabel {
-                color: #e74c3c;
-                background-color: #fdf2f2;
-                border: 1px solid #f5c6cb;
-                border-radius: 6px;
-                padding: 8px;
-                margin: 5px 0px;
-                font-size: 12px;
-            }
-        """)
-    
-    def hide_error(self):
-        """Hide error message."""
-        self.error_label.hide()
-        self.error_label.setText("")
-    
-    def setup_styling(self):
-        c = self.colors  # Shorthand for colors
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: transparent;
-            }}
-            
-            QFrame#mainFrame {{
-                background-color: {c['bg']};
-                border-radius: 15px;
-                border: 1px solid {c['border']};
-            }}
-            
-            QLabel#title {{
-                font-size: 22px;
-                font-weight: bold;
-                color: {c['text']};
-                margin-bottom: 5px;
-                padding: 5px 0px;
-            }}
-            
-            QLabel#subtitle {{
-                font-size: 13px;
-                color: {c['text_secondary']};
-                padding: 2px 0px;
-            }}
-            
-            QLabel#fieldLabel {{
-                color: {c['text']};
-                font-weight: bold;
-                font-size: 13px;
-                margin-bottom: 3px;
-                padding: 3px 2px;
-                background-color: transparent;
-                min-height: 20px;
-                max-height: 20px;
-            }}
-            
-            QLineEdit#input {{
-                border: 2px solid {c['input_border']};
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                background-color: {c['input_bg']};
-                color: {c['text']};
-                margin: 1px 0px;
-                min-height: 20px;
-                max-height: 40px;
-            }}
-            
-            QLineEdit#input:focus {{
-                border-color: {c['primary']};
-                background-color: {c['bg_widget']};
-                outline: none;
-            }}
-            
-            QCheckBox#checkbox {{
-                color: {c['text']};
-                font-size: 13px;
-                margin-top: 3px;
-                padding: 5px 0px;
-                spacing: 8px;
-                min-height: 25px;
-                max-height: 25px;
-            }}
-            
-            QCheckBox#checkbox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {c['input_border']};
-                border-radius: 4px;
-                background-color: {c['bg_widget']};
-                margin-right: 8px;
-            }}
-            
-            QCheckBox#checkbox::indicator:checked {{
-                background-color: {c['primary']};
-                border-color: {c['primary']};
-                image: url(none);
-            }}
-            
-            QLabel#errorLabel {{
-                color: #e74c3c;
-                background-color: {c['error_bg']};
-                border: 1px solid {c['error_border']};
-                border-radius: 6px;
-                padding: 8px;
-                margin: 5px 0px;
-                font-size: 12px;
-            }}
-            
-            QPushButton#loginButton {{
-                background-color: {c['primary']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-                min-height: 42px;
-                max-height: 42px;
-            }}
-            
-            QPushButton#loginButton:hover {{
-                background-color: {c['primary_hover']};
-            }}
-            
-            QPushButton#loginButton:pressed {{
-                background-color: #1c5a85;
-            }}
-            
-            QPushButton#cancelButton {{
-                background-color: transparent;
-                color: {c['text_secondary']};
-                border: 2px solid {c['border']};
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                min-width: 100px;
-                min-height: 42px;
-                max-height: 42px;
-            }}
-            
-            QPushButton#cancelButton:hover {{
-                border-color: {c['text_secondary']};
-                color: {c['text']};
-                background-color: {c['bg_alt']};
-            }}
-            
-            QPushButton#cancelButton:pressed {{
-                background-color: {c['bg_widget']};
-            }}
-            
-            QLabel#registerText {{
-                color: {c['text_secondary']};
-                font-size: 13px;
-            }}
-            
-            QLabel#registerLink {{
-                font-size: 13px;
-            }}
-            
-            QLabel#registerLink a {{
-                color: {c['primary']};
-                text-decoration: none;
-                font-weight: bold;
-            }}
-            
-            QLabel#registerLink a:hover {{
-                text-decoration: underline;
-            }}
-        """)
+    def show_error(self, message: str):
+        """Show error message in the dialog."""
+        self.error_label.setText(message)
+        self.error_label.show()
+        
+        # Briefly highlight the error with animation
+        self.error_label.setStyleSheet(_ERROR_LABEL_QSS)
+    
+    def hide_error(self):
+        """Hide error message."""
+        self.error_label.hide()
+        self.error_label.setText("")
+    
+    def setup_styling(self):
+        self.setStyleSheet(_themed_qss(_LOGIN_QSS, self.colors))
     
     def get_credentials(self):
         """Get entered credentials."""
@@ -3001,6 +4244,11 @@ class LoginDialog(QDialog):
 class HaioDriveClient(QMainWindow):
     """Main application window."""
     
+    # New bucket widgets built per event-loop turn in display_buckets
+    BUCKET_WIDGET_BATCH = 20
+    # Quiet period after the last auto-mount checkbox click before dispatching
+    AUTO_MOUNT_DEBOUNCE_MS = 250
+    
     def __init__(self):
         super().__init__()
         self.api_client = ApiClient()
@@ -3012,24 +4260,47 @@ class HaioDriveClient(QMainWindow):
         self.colors = None
         
         # Set application icon
+        self._icon_set = False
         self.set_application_icon()
         
-        # Check dependencies on startup
-        self.check_dependencies()
+        # Check dependencies once the event loop is running, in the background, so
+        # neither the probe nor the worker start-up delays the first paint
+        self.dependency_worker = None
+        QTimer.singleShot(0, self.check_dependencies)
         
         self.current_user = None
         self.buckets = []
         self.bucket_widgets = []
+        self._widgets_by_name: Dict[str, BucketWidget] = {}
+        self._widgets_by_mount: Dict[str, BucketWidget] = {}
+        self._display_continuation = False
+        
+        # Auto-mount toggles waiting for the next flush: bucket name -> mount point
+        # to enable at, or None to disable. A short debounce gathers rapid clicks.
+        self._pending_toggles: Dict[str, Optional[str]] = {}
+        self._auto_mount_batch_running = False
+        self._toggle_timer = QTimer(self)
+        self._toggle_timer.setSingleShot(True)
+        self._toggle_timer.setInterval(self.AUTO_MOUNT_DEBOUNCE_MS)
+        self._toggle_timer.timeout.connect(self._flush_toggles)
+        
+        # Home directory and per-user mount path prefix (set on login)
+        self._user_home = _USER_HOME
+        self._mount_prefix = None
         
         # Track if user has ever logged in (to handle logout vs initial login)
         self.has_logged_in = False
         
+        # Login dialog is built on first use and reused across logout cycles
+        self._login_dialog = None
+        
         # Store active workers to prevent premature destruction
-        self.active_workers = []
+        self.active_workers: Set[QThread] = set()
         
         # Initialize theme after QApplication is available
         self.theme = ThemeManager(QApplication.instance())
         self.colors = self.theme.get_colors()
+        self._styled_colors = None
         
         self.setup_ui()
         self.setup_styling()
@@ -3039,6 +4310,21 @@ class HaioDriveClient(QMainWindow):
         self.stats_sync_timer.timeout.connect(self.sync_bucket_stats)
         self.stats_sync_timer.setInterval(30000)  # 30 seconds in milliseconds
         
+        # One long-lived worker per listing purpose; QThread can be re-started
+        # once run() returns, so refreshes don't build new thread objects
+        self.bucket_worker = BucketWorker(self.api_client)
+        self.bucket_worker.finished.connect(self.on_buckets_loaded)
+        self._bucket_reload_pending = False
+        self.stats_worker = BucketWorker(self.api_client)
+        self.stats_worker.finished.connect(self.on_bucket_stats_synced)
+        
+        # Coalesce bursts of mount/auto-mount status updates into one repaint
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(lambda: self.status_bar.showMessage(self._pending_status))
+        
         # Auto-login if credentials are saved
         # Don't show window initially - show only after login
         self.try_auto_login()
@@ -3052,79 +4338,23 @@ class HaioDriveClient(QMainWindow):
         for widget in self.bucket_widgets:
             widget.update()
     
-    def set_application_icon(self):
-        """Set the application icon for window and taskbar."""
-        try:
-            # Try to load the logo file first
-            logo_path = os.path.join(os.path.dirname(__file__), "haio-logo.png")
-            
-            if os.path.exists(logo_path):
-                # Use the actual logo file
-                icon = QIcon(logo_path)
-            else:
-                # Create a fallback icon programmatically
-                icon = self.create_fallback_icon()
-            
-            # Set icon for the application and window
-            self.setWindowIcon(icon)
-            QApplication.instance().setWindowIcon(icon)
-            
-        except Exception as e:
-            print(f"Error setting application icon: {e}")
-            # Create a simple fallback icon
-            self.setWindowIcon(self.create_simple_fallback_icon())
-    
-    def create_fallback_icon(self):
-        """Create a fallback icon with Haio branding."""
-        # Create a 64x64 icon
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Create gradient background
-        gradient = QLinearGradient(0, 0, 64, 64)
-        gradient.setColorAt(0, QColor("#4CAF50"))
-        gradient.setColorAt(1, QColor("#45a049"))
-        
-        # Draw circle background
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 60, 60)
-        
-        # Draw letter "H" in white
-        painter.setPen(QColor(Qt.GlobalColor.white))
-        font = QFont("Arial", 24, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "H")
-        
-        painter.end()
-        return QIcon(pixmap)
-    
-    def create_simple_fallback_icon(self):
-        """Create a very simple fallback icon."""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor("#4CAF50"))
-        return QIcon(pixmap)
-    
     def check_dependencies(self):
         """Check if all required dependencies are available."""
-        issues = self.rclone_manager.check_dependencies()
-        
+        self.dependency_worker = DependencyWorker(self.rclone_manager)
+        self.dependency_worker.finished.connect(self.on_dependencies_checked)
+        self.dependency_worker.start()
+    
+    def on_dependencies_checked(self, issues: List[str]):
+        """Handle dependency check completion."""
         if issues:
             # Check if WinFsp installation is available
             winfsp_installer_available = False
             winfsp_needs_install = False
             
-            if platform.system() == "Windows":
-                for issue in issues:
-                    if "WinFsp" in issue and "Installer available" in issue:
-                        winfsp_installer_available = True
-                        winfsp_needs_install = True
-                        break
-                    elif "WinFsp" in issue:
-                        winfsp_needs_install = True
+            if _IS_WINDOWS:
+                winfsp_issues = [issue for issue in issues if "WinFsp" in issue]
+                winfsp_needs_install = bool(winfsp_issues)
+                winfsp_installer_available = any("Installer available" in issue for issue in winfsp_issues)
             
             # If WinFsp installer is available, offer to install it automatically
             if winfsp_installer_available:
@@ -3156,7 +4386,7 @@ class HaioDriveClient(QMainWindow):
             msg.setText("Some required dependencies are missing:")
             msg.setDetailedText(issue_text)
             
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 if winfsp_needs_install and not winfsp_installer_available:
                     msg.setInformativeText(
                         "To use this application on Windows:\n"
@@ -3180,60 +4410,14 @@ class HaioDriveClient(QMainWindow):
             
             msg.exec()
     
-    def closeEvent(self, event):
-        """Handle application close event."""
-        # Wait for all active workers to finish
-        for worker in self.active_workers:
-            if worker.isRunning():
-                worker.wait(3000)  # Wait up to 3 seconds
-        
-        event.accept()
-    
     def set_application_icon(self):
-        """Set the application icon from logo file or create a default one."""
-        # Try to load the Haio logo
-        logo_path = os.path.join(os.path.dirname(__file__), "haio-logo.png")
-        
-        if os.path.exists(logo_path):
-            # Use the existing logo file
-            icon = QIcon(logo_path)
-            self.setWindowIcon(icon)
-            # Also set it as application icon for taskbar/dock
-            QApplication.instance().setWindowIcon(icon)
-        else:
-            # Create a simple default icon if logo file doesn't exist
-            self.create_default_icon()
-    
-    def create_default_icon(self):
-        """Create a default icon with the Haio colors and branding."""
-        # Create a 64x64 pixmap for the icon
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Create gradient background
-        gradient = QLinearGradient(0, 0, 64, 64)
-        gradient.setColorAt(0, QColor("#4CAF50"))  # Haio green
-        gradient.setColorAt(1, QColor("#45a049"))  # Darker green
-        
-        # Draw circular background
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 60, 60)
-        
-        # Draw "H" letter in white
-        painter.setPen(QColor("white"))
-        font = QFont("Arial", 28, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "H")
-        
-        painter.end()
-        
-        # Set the icon
-        icon = QIcon(pixmap)
+        """Set the application icon for window and taskbar."""
+        if self._icon_set:
+            return
+        self._icon_set = True
+        icon = _app_icon()
         self.setWindowIcon(icon)
+        # Also set it as application icon for taskbar/dock
         QApplication.instance().setWindowIcon(icon)
     
     def setup_ui(self):
@@ -3241,9 +4425,6 @@ class HaioDriveClient(QMainWindow):
         self.setMinimumSize(800, 600)
         self.resize(1000, 700)
         
-        # Set application icon
-        self.set_application_icon()
-        
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -3256,18 +4437,17 @@ class HaioDriveClient(QMainWindow):
         # Header
         self.create_header(main_layout)
         
-        # Content area
-        self.content_stack = QStackedWidget()
+        # Content area: two pages toggled by visibility, so the hidden one
+        # isn't laid out on every resize the way a QStackedWidget page is
         
         # Loading page
         self.loading_page = self.create_loading_page()
-        self.content_stack.addWidget(self.loading_page)
+        main_layout.addWidget(self.loading_page)
         
         # Buckets page
         self.buckets_page = self.create_buckets_page()
-        self.content_stack.addWidget(self.buckets_page)
-        
-        main_layout.addWidget(self.content_stack)
+        self.buckets_page.hide()
+        main_layout.addWidget(self.buckets_page)
         
         # Status bar
         self.status_bar = QStatusBar()
@@ -3298,35 +4478,13 @@ class HaioDriveClient(QMainWindow):
         
         logo_label = QLabel()
         
-        # Try SVG first (transparent background), then PNG fallback
-        svg_path = os.path.join(os.path.dirname(__file__), "haio-logo.svg")
-        png_path = os.path.join(os.path.dirname(__file__), "haio-logo.png")
-        
-        logo_loaded = False
-        
-        # Try loading SVG first
-        if os.path.exists(svg_path):
-            pixmap = QPixmap(svg_path)
-            if not pixmap.isNull():
-                # Scale SVG logo to fit nicely in the dark circle
-                scaled_pixmap = pixmap.scaled(55, 55, Qt.AspectRatioMode.KeepAspectRatio, 
-                                             Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                logo_label.setStyleSheet("background: transparent;")
-                logo_loaded = True
-        
-        # Fallback to PNG if SVG didn't work
-        if not logo_loaded and os.path.exists(png_path):
-            pixmap = QPixmap(png_path)
-            if not pixmap.isNull():
-                # Scale PNG logo
-                scaled_pixmap = pixmap.scaled(55, 55, Qt.AspectRatioMode.KeepAspectRatio, 
-                                             Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                logo_label.setStyleSheet("background: transparent;")
-                logo_loaded = True
+        # SVG preferred (transparent background), then PNG
+        scaled_pixmap = _logo_pixmap(55)
+        logo_loaded = scaled_pixmap is not None
+        if logo_loaded:
+            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            logo_label.setStyleSheet("background: transparent;")
         
         # Final fallback to cloud emoji if no logo files found
         if not logo_loaded:
@@ -3414,13 +4572,22 @@ class HaioDriveClient(QMainWindow):
         parent_layout.addWidget(header)
     
     def create_circular_logo(self, pixmap, size):
-        """Create a circular version of the logo to remove background."""
+        """Create a circular version of the logo to remove background (cached per pixmap/size/DPR)."""
+        dpr = self.devicePixelRatioF()
+        cache_key = f"haio_circular_logo_{pixmap.cacheKey()}_{size}_{dpr}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Render at physical resolution so HiDPI screens don't rescale it
+        physical = round(size * dpr)
+        
         # Scale pixmap to desired size
-        scaled_pixmap = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, 
+        scaled_pixmap = pixmap.scaled(physical, physical, Qt.AspectRatioMode.KeepAspectRatio, 
                                      Qt.TransformationMode.SmoothTransformation)
         
         # Create circular mask
-        circular_pixmap = QPixmap(size, size)
+        circular_pixmap = QPixmap(physical, physical)
         circular_pixmap.fill(Qt.GlobalColor.transparent)
         
         painter = QPainter(circular_pixmap)
@@ -3428,15 +4595,23 @@ class HaioDriveClient(QMainWindow):
         
         # Set circular clipping region
         path = QPainterPath()
-        path.addEllipse(0, 0, size, size)
+        path.addEllipse(0, 0, physical, physical)
         painter.setClipPath(path)
         
         # Draw the scaled pixmap within the circular clip
         painter.drawPixmap(0, 0, scaled_pixmap)
         
         painter.end()
+        circular_pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_key, circular_pixmap)
         return circular_pixmap
     
+    def _show_page(self, page: QWidget):
+        """Show the loading or buckets page and hide the other."""
+        other = self.buckets_page if page is self.loading_page else self.loading_page
+        other.hide()
+        page.show()
+    
     def create_loading_page(self):
         """Create loading page."""
         page = QWidget()
@@ -3493,7 +4668,18 @@ class HaioDriveClient(QMainWindow):
         self.buckets_layout = QVBoxLayout(self.buckets_container)
         self.buckets_layout.setSpacing(15)
         self.buckets_layout.setContentsMargins(5, 5, 5, 5)
-        self.buckets_layout.addStretch()
+        
+        # Empty state is built once and toggled by display_buckets
+        self._empty_label = QLabel("No buckets found.\nCreate buckets using the web interface.")
+        self._empty_label.setObjectName("emptyStateLabel")
+        self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._empty_label.setStyleSheet("color: #7f8c8d; font-size: 16px; margin: 50px;")
+        self._empty_label.hide()
+        self.buckets_layout.insertWidget(0, self._empty_label)
+        
+        # Trailing stretch is kept as an item so display_buckets can detach it while batching
+        self._buckets_stretch = QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+        self.buckets_layout.addItem(self._buckets_stretch)
         
         scroll_area.setWidget(self.buckets_container)
         layout.addWidget(scroll_area)
@@ -3503,243 +4689,73 @@ class HaioDriveClient(QMainWindow):
     def setup_styling(self):
         """Apply application styling with theme support."""
         c = self.colors  # Shorthand for colors
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {c['bg_alt']};
-            }}
-            
-            QFrame#header {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {c['primary']}, stop:1 {c['primary_hover']});
-                border-bottom: 3px solid {c['primary_hover']};
-            }}
-            
-            QFrame#logoContainer {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(52, 152, 219, 0.3), stop:1 rgba(41, 128, 185, 0.3));
-                border-radius: 35px;
-                border: 3px solid rgba(255, 255, 255, 0.2);
-            }}
-            
-            QLabel#appTitle {{
-                color: white;
-                font-size: 22px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-            }}
-            
-            QLabel#userLabel {{
-                color: rgba(255, 255, 255, 0.85);
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            
-            QPushButton#headerButton {{
-                background-color: rgba(255, 255, 255, 0.15);
-                color: white;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                padding: 12px 20px;
-                font-weight: 600;
-                font-size: 14px;
-                margin: 0 2px;
-                min-width: 100px;
-            }}
-            
-            QPushButton#headerButton:hover {{
-                background-color: rgba(255, 255, 255, 0.3);
-                border-color: rgba(255, 255, 255, 0.6);
-            }}
-            
-            QPushButton#headerButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.1);
-            }}
-            
-            QPushButton#logoutButton {{
-                background-color: rgba(231, 76, 60, 0.8);
-                color: white;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                padding: 12px 20px;
-                font-weight: 600;
-                font-size: 14px;
-                margin: 0 2px;
-                min-width: 100px;
-            }}
-            
-            QPushButton#logoutButton:hover {{
-                background-color: rgba(192, 57, 43, 0.9);
-                border-color: rgba(255, 255, 255, 0.6);
-            }}
-            
-            QPushButton#logoutButton:pressed {{
-                background-color: rgba(192, 57, 43, 0.7);
-            }}
-            
-            QPushButton#consoleButton {{
-                background-color: rgba(52, 152, 219, 0.8);
-                color: white;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                padding: 12px 20px;
-                font-weight: 600;
-                font-size: 14px;
-                margin: 0 2px;
-                min-width: 110px;
-            }}
-            
-            QPushButton#consoleButton:hover {{
-                background-color: rgba(41, 128, 185, 0.9);
-                border-color: rgba(255, 255, 255, 0.6);
-            }}
-            
-            QPushButton#consoleButton:pressed {{
-                background-color: rgba(41, 128, 185, 0.7);
-            }}
-            
-            QPushButton#iconButton {{
-                background-color: rgba(52, 152, 219, 0.1);
-                color: {c['text']};
-                border: none;
-                border-radius: 8px;
-                font-size: 20px;
-                font-weight: 500;
-                padding: 0px;
-            }}
-            
-            QPushButton#iconButton:hover {{
-                background-color: rgba(52, 152, 219, 0.2);
-                color: #3498db;
-            }}
-            
-            QPushButton#iconButton:pressed {{
-                background-color: rgba(52, 152, 219, 0.3);
-            }}
-            
-            QLabel#loadingLabel {{
-                font-size: 16px;
-                color: {c['text']};
-            }}
-            
-            QLabel#pageTitle {{
-                font-size: 26px;
-                font-weight: bold;
-                color: {c['text']};
-                margin-bottom: 5px;
-            }}
-            
-            QLabel#pageSubtitle {{
-                font-size: 14px;
-                color: {c['text_secondary']};
-                margin-bottom: 10px;
-            }}
-            
-            QScrollArea#bucketsScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            
-            QScrollArea#bucketsScrollArea QScrollBar:vertical {{
-                background-color: {c['bg_widget']};
-                width: 12px;
-                border-radius: 6px;
-                margin: 2px;
-            }}
-            
-            QScrollArea#bucketsScrollArea QScrollBar::handle:vertical {{
-                background-color: {c['border']};
-                border-radius: 5px;
-                min-height: 30px;
-            }}
-            
-            QScrollArea#bucketsScrollArea QScrollBar::handle:vertical:hover {{
-                background-color: {c['text_secondary']};
-            }}
-            
-            QScrollArea#bucketsScrollArea QScrollBar::add-line:vertical,
-            QScrollArea#bucketsScrollArea QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            
-            QProgressBar {{
-                border: 2px solid {c['border']};
-                border-radius: 8px;
-                text-align: center;
-                background-color: {c['bg_widget']};
-                color: {c['text']};
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {c['primary']};
-                border-radius: 6px;
-            }}
-        """)
+        # Skip the restyle (and Qt's full style recalculation) unless the colors changed
+        if self._styled_colors == c:
+            return
+        self.setStyleSheet(_themed_qss(_MAIN_QSS, self.colors))
+        self._styled_colors = dict(c)
     
     def try_auto_login(self):
         """Try to automatically login with saved credentials."""
         # Start with loading page first
-        self.content_stack.setCurrentWidget(self.loading_page)
+        self._show_page(self.loading_page)
         
         # Check for saved credentials
         try:
-            import os
-            token_file = os.path.join(self.token_manager.config_dir, "tokens.json")
-            
-            if os.path.exists(token_file):
-                import json
-                with open(token_file, 'r') as f:
-                    data = json.load(f)
+            # Try to find a saved user with credentials
+            for username in self.token_manager.saved_usernames():
+                password = self.token_manager.get_password(username)
                 
-                # Try to find a saved user with credentials
-                for username, user_data in data.items():
-                    password = self.token_manager.get_password(username)
+                if password:
+                    # Found saved credentials, try auto-login
+                    self.status_bar.showMessage(f"Auto-login as {username}...")
                     
-                    if password:
-                        # Found saved credentials, try auto-login
-                        self.status_bar.showMessage(f"Auto-login as {username}...")
+                    # Attempt authentication
+                    if self.api_client.authenticate(username, password):
+                        self.current_user = username
+                        self._mount_prefix = _home_mount_prefix(username)
+                        self.user_label.setText(f"Logged in as: {username}")
                         
-                        # Attempt authentication
-                        if self.api_client.authenticate(username, password):
-                            self.current_user = username
-                            self.user_label.setText(f"Logged in as: {username}")
-                            
-                            # Mark that user has logged in successfully
-                            self.has_logged_in = True
-                            
-                            # Setup rclone
-                            self.rclone_manager.setup_rclone_config(username, password)
-                            
-                            # Show main window
-                            self.show()
-                            
-                            # Load buckets
-                            self.load_buckets()
-                            
-                            # Start stats syncing timer
-                            self.stats_sync_timer.start()
-                            
-                            return  # Success!
-                        else:
-                            # Saved credentials invalid, remove them
-                            print(f"Saved credentials for {username} are invalid, clearing...")
-                            if 'password_enc' in user_data:
-                                del user_data['password_enc']
-                            if 'password' in user_data:
-                                del user_data['password']
-                            
-                            # Save cleared data
-                            with open(token_file, 'w') as f:
-                                json.dump(data, f, indent=2)
+                        # Mark that user has logged in successfully
+                        self.has_logged_in = True
+                        
+                        # Start loading buckets first so the listing request is
+                        # in flight while the rclone config is written
+                        self.load_buckets()
+                        
+                        # Setup rclone
+                        self.rclone_manager.setup_rclone_config(username, password)
+                        
+                        # Show main window
+                        self.show()
+                        
+                        # Start stats syncing timer
+                        self.stats_sync_timer.start()
+                        
+                        return  # Success!
+                    else:
+                        # Saved credentials invalid, remove them
+                        print(f"Saved credentials for {username} are invalid, clearing...")
+                        self.token_manager.clear_password(username)
             
         except Exception as e:
             print(f"Auto-login error: {e}")
         
         # No saved credentials or auto-login failed, show login dialog
-        QTimer.singleShot(100, self.show_login_dialog)
+        # on the next event loop iteration rather than after a fixed delay
+        QMetaObject.invokeMethod(self, "show_login_dialog", Qt.ConnectionType.QueuedConnection)
     
+    @pyqtSlot()
     def show_login_dialog(self):
         """Show the login dialog."""
-        dialog = LoginDialog(self)
+        if self._login_dialog is None:
+            self._login_dialog = LoginDialog(self)
+        dialog = self._login_dialog
+        # Only the password is reset between attempts; a retry keeps the username
+        dialog.password_input.clear()
+        dialog.hide_error()
+        if dialog.username_input.text():
+            dialog.password_input.setFocus()
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             credentials = dialog.get_credentials()
@@ -3756,50 +4772,52 @@ class HaioDriveClient(QMainWindow):
     
     def login(self, username: str, password: str, remember: bool = False):
         """Perform login setup after successful authentication."""
-        self.content_stack.setCurrentWidget(self.loading_page)
+        self._show_page(self.loading_page)
         self.status_bar.showMessage("Setting up your account...")
         
         self.current_user = username
+        self._mount_prefix = _home_mount_prefix(username)
         self.user_label.setText(f"Logged in as: {username}")
         
+        # Start loading buckets first so the listing request is in flight
+        # while the rclone config and credentials are written
+        self.load_buckets()
+        
         # Setup rclone configuration
         self.rclone_manager.setup_rclone_config(username, password)
         
         # Save credentials if requested
         if remember:
-            self.token_manager.save_token(username, self.api_client.token)
-            # Store password securely for auto-mount usage
-            self.token_manager.save_password(username, password)
+            # Token and password (stored securely for auto-mount usage) in one write
+            self.token_manager.save_token(username, self.api_client.token, password)
         
         # Show main window after successful login
         self.show()
-        
-        # Load buckets
-        self.load_buckets()
     
     def on_auth_finished(self, success: bool, username: str, password: str, remember: bool):
         """Handle authentication completion."""
         if success:
             self.current_user = username
+            self._mount_prefix = _home_mount_prefix(username)
             self.user_label.setText(f"Logged in as: {username}")
             
             # Mark that user has logged in successfully
             self.has_logged_in = True
             
+            # Start loading buckets first so the listing request is in flight
+            # while the rclone config and credentials are written
+            self.load_buckets()
+            
             # Setup rclone configuration
             self.rclone_manager.setup_rclone_config(username, password)
             
             # Save credentials if requested
             if remember:
-                self.token_manager.save_token(username, self.api_client.token)
-                self.token_manager.save_password(username, password)
+                self.token_manager.save_token(username, self.api_client.token, password)
             
             # Show main window after successful login
             self.show()
             
-            # Load buckets
-            self.load_buckets()
-            
             # Start stats syncing timer
             self.stats_sync_timer.start()
         else:
@@ -3814,15 +4832,24 @@ class HaioDriveClient(QMainWindow):
     def load_buckets(self):
         """Load user's buckets."""
         self.status_bar.showMessage("Loading buckets...")
-        self.content_stack.setCurrentWidget(self.loading_page)
+        self._show_page(self.loading_page)
         
-        # Create and start bucket loading worker
-        self.bucket_worker = BucketWorker(self.api_client)
-        self.bucket_worker.finished.connect(self.on_buckets_loaded)
+        # A listing already in flight may predate this request (e.g. another
+        # login), so fetch again as soon as it reports back
+        if self.bucket_worker.isRunning():
+            self._bucket_reload_pending = True
+            return
         self.bucket_worker.start()
     
     def on_buckets_loaded(self, buckets: List[Dict]):
         """Handle buckets loading completion."""
+        if self._bucket_reload_pending:
+            self._bucket_reload_pending = False
+            # finished is emitted from run(), so let run() return before restarting
+            self.bucket_worker.wait()
+            self.bucket_worker.start()
+            return
+        
         if buckets is None:
             # API call failed, show error
             self.status_bar.showMessage("Failed to load buckets - retrying...")
@@ -3837,49 +4864,140 @@ class HaioDriveClient(QMainWindow):
         self.display_buckets()
     
     def display_buckets(self):
-        """Display buckets in the UI."""
-        # Clear existing widgets AND remove any empty state labels
-        while self.buckets_layout.count() > 1:  # Keep the stretch at the end
-            item = self.buckets_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.bucket_widgets.clear()
-        
-        # Add bucket widgets
-        for bucket in self.buckets:
-            widget = BucketWidget(bucket, self.current_user, self.rclone_manager)
-            widget.mount_requested.connect(self.mount_bucket)
-            widget.unmount_requested.connect(self.unmount_bucket)
-            widget.auto_mount_changed.connect(self.toggle_auto_mount)
-            
-            self.bucket_widgets.append(widget)
-            self.buckets_layout.insertWidget(self.buckets_layout.count() - 1, widget)
-        
-        # After creating all widgets, scan for existing mounts
-        self.scan_existing_mounts()
+        """Display buckets in the UI.
         
-        if not self.buckets:
-            # Show empty state (only if no widgets exist)
-            empty_label = QLabel("No buckets found.\nCreate buckets using the web interface.")
-            empty_label.setObjectName("emptyStateLabel")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_label.setStyleSheet("color: #7f8c8d; font-size: 16px; margin: 50px;")
-            self.buckets_layout.insertWidget(0, empty_label)
+        At most BUCKET_WIDGET_BATCH new widgets are built per call; if more are
+        needed the rest follow on later event-loop turns, so long lists fill in
+        progressively instead of holding the loading page until all are built.
+        """
+        self._display_continuation = False
+        created = 0
+        # Suspend repaints and detach the trailing stretch so the rebuild
+        # appends widgets instead of re-inserting ahead of the stretch each time
+        self.buckets_container.setUpdatesEnabled(False)
+        try:
+            self.buckets_layout.removeItem(self._buckets_stretch)
+
+            # Drop widgets for buckets that are gone (or belong to another user),
+            # keeping the cached empty state label
+            new_names = {bucket['name'] for bucket in self.buckets}
+            for name, widget in list(self._widgets_by_name.items()):
+                if name not in new_names or widget.username != self.current_user:
+                    self.buckets_layout.removeWidget(widget)
+                    widget.deleteLater()
+                    del self._widgets_by_name[name]
+                    if self._widgets_by_mount.get(widget.mount_point) is widget:
+                        del self._widgets_by_mount[widget.mount_point]
+
+            self.bucket_widgets = []
+
+            # Add widgets for new buckets and refresh stats on retained ones
+            for bucket in self.buckets:
+                widget = self._widgets_by_name.get(bucket['name'])
+                if widget is None:
+                    if created == self.BUCKET_WIDGET_BATCH:
+                        self._display_continuation = True
+                        continue
+                    created += 1
+                    widget = BucketWidget(bucket, self.current_user, self.rclone_manager)
+                    widget.mount_requested.connect(self.mount_bucket)
+                    widget.unmount_requested.connect(self.unmount_bucket)
+                    widget.auto_mount_changed.connect(self.toggle_auto_mount)
+                    self._widgets_by_name[bucket['name']] = widget
+                    self._widgets_by_mount[widget.mount_point] = widget
+                else:
+                    widget.bucket_info = bucket
+                    widget.update_stats(bucket.get('count', 0), bucket.get('bytes', 0))
+
+                self.bucket_widgets.append(widget)
+
+            # Slot 0 holds the empty state label. If the laid-out order differs,
+            # pop the bucket items off the end and append them in the new order:
+            # both are O(1) per item, unlike indexOf/insertWidget per bucket
+            layout = self.buckets_layout
+            laid_out = [layout.itemAt(i).widget() for i in range(1, layout.count())]
+            if laid_out != self.bucket_widgets:
+                while layout.count() > 1:
+                    layout.takeAt(layout.count() - 1)
+                for widget in self.bucket_widgets:
+                    layout.addWidget(widget)
+
+            # After creating all widgets, scan for existing mounts
+            if not self._display_continuation:
+                self.scan_existing_mounts()
+                self._probe_auto_mount_states()
+
+            # Show empty state only if no widgets exist
+            self._empty_label.setVisible(not self.buckets)
+
+            self.buckets_layout.addItem(self._buckets_stretch)
+        finally:
+            self.buckets_container.setUpdatesEnabled(True)
+
+        self._show_page(self.buckets_page)
         
-        self.content_stack.setCurrentWidget(self.buckets_page)
+        if self._display_continuation:
+            # Build the next batch once this one has painted
+            QTimer.singleShot(0, self._continue_display_buckets)
+            return
         
         # Show helpful message about mount locations
-        user_home = os.path.expanduser("~")
         bucket_count = len(self.buckets)
         if bucket_count > 0:
-            self.status_bar.showMessage(f"Loaded {bucket_count} buckets • Buckets mount to {user_home}/haio-{self.current_user}-[bucket-name]")
+            self.status_bar.showMessage(f"Loaded {bucket_count} buckets • Buckets mount to {self._mount_path_for('[bucket-name]')}")
         else:
             self.status_bar.showMessage("No buckets found")
     
+    def _continue_display_buckets(self):
+        """Build the next batch of bucket widgets, unless a newer display already finished."""
+        if self._display_continuation:
+            self.display_buckets()
+    
+    def _probe_auto_mount_states(self):
+        """Look up auto-mount state for buckets whose checkbox state isn't known yet."""
+        unknown = [bucket['name'] for bucket in self.buckets
+                   if self.rclone_manager.known_auto_mount_state(self.current_user, bucket['name']) is None]
+        if not unknown:
+            return
+        
+        username = self.current_user
+        worker = AutoMountProbeWorker(self.rclone_manager, username, unknown)
+        self._track_worker(worker)
+        worker.finished.connect(functools.partial(self.on_auto_mount_probed, username))
+        worker.start()
+    
+    def on_auto_mount_probed(self, username: str, states: Dict[str, bool]):
+        """Update auto-mount checkboxes once the background probe reports back."""
+        for bucket_name, enabled in states.items():
+            widget = self._widgets_by_name.get(bucket_name)
+            if widget is not None and widget.username == username:
+                widget.set_auto_mount_enabled(enabled)
+    
+    def _show_status(self, message: str):
+        """Show a status bar message, collapsing rapid successive updates."""
+        self._pending_status = message
+        self._status_timer.start()
+    
+    def _mount_path_for(self, bucket_name: str) -> str:
+        """Return the default home-directory mount path for a bucket of the current user."""
+        return self._mount_prefix + bucket_name
+    
+    def _track_worker(self, worker: QThread):
+        """Keep a worker referenced while it runs and release it as soon as it reports back."""
+        self.active_workers.add(worker)
+        worker.finished.connect(functools.partial(self._release_worker, worker))
+    
+    def _release_worker(self, worker: QThread, *_):
+        """Drop a finished worker and let Qt free its thread resources."""
+        self.active_workers.discard(worker)
+        # finished is emitted from run(), so let run() return before scheduling deletion
+        worker.wait()
+        worker.deleteLater()
+    
+    @pyqtSlot(str, str)
     def mount_bucket(self, bucket_name: str, mount_point: str):
         """Mount a bucket."""
-        self.status_bar.showMessage(f"Mounting {bucket_name}...")
+        self._show_status(f"Mounting {bucket_name}...")
         
         worker = MountWorker('mount', self.rclone_manager,
                            username=self.current_user,
@@ -3887,73 +5005,62 @@ class HaioDriveClient(QMainWindow):
                            mount_point=mount_point)
         
         # Store worker to prevent premature destruction
-        self.active_workers.append(worker)
+        self._track_worker(worker)
         
         # Connect signals
-        worker.finished.connect(lambda success, msg: self.on_mount_finished(success, msg, bucket_name, worker))
+        worker.finished.connect(functools.partial(self.on_mount_finished, bucket_name=bucket_name))
         worker.start()
     
+    @pyqtSlot(str)
     def unmount_bucket(self, mount_point: str):
         """Unmount a bucket."""
-        self.status_bar.showMessage("Unmounting...")
+        self._show_status("Unmounting...")
         
         worker = MountWorker('unmount', self.rclone_manager, mount_point=mount_point)
         
         # Store worker to prevent premature destruction
-        self.active_workers.append(worker)
+        self._track_worker(worker)
         
         # Connect signals
-        worker.finished.connect(lambda success, msg: self.on_unmount_finished(success, msg, worker))
+        worker.finished.connect(functools.partial(self.on_unmount_finished, mount_point=mount_point))
         worker.start()
     
-    def on_mount_finished(self, success: bool, message: str, bucket_name: str, worker: MountWorker):
+    def on_mount_finished(self, success: bool, message: str, bucket_name: str):
         """Handle mount operation completion."""
-        # Remove worker from active list
-        if worker in self.active_workers:
-            self.active_workers.remove(worker)
-        
+        widget = self._widgets_by_name.get(bucket_name)
         if success:
-            # Find the bucket widget to get the actual mount point used
-            mount_point = None
-            for widget in self.bucket_widgets:
-                if widget.bucket_info['name'] == bucket_name:
-                    mount_point = widget.mount_point
-                    break
-            
-            if mount_point:
-                self.status_bar.showMessage(f"✓ {bucket_name} mounted at {mount_point}")
+            # The bucket widget holds the actual mount point used
+            if widget is not None and widget.mount_point:
+                self._show_status(f"✓ {bucket_name} mounted at {widget.mount_point}")
             else:
-                self.status_bar.showMessage(f"✓ {bucket_name} mounted successfully")
+                self._show_status(f"✓ {bucket_name} mounted successfully")
         else:
-            self.status_bar.showMessage(f"✗ Mount failed: {message}")
+            self._show_status(f"✗ Mount failed: {message}")
             QMessageBox.warning(self, "Mount Failed", f"Failed to mount {bucket_name}:\n{message}")
         
-        # Update widget status
-        for widget in self.bucket_widgets:
+        # Only the mounted bucket's state changed
+        if widget is not None:
             widget.update_mount_status()
     
-    def on_unmount_finished(self, success: bool, message: str, worker: MountWorker):
+    def on_unmount_finished(self, success: bool, message: str, mount_point: str):
         """Handle unmount operation completion."""
-        # Remove worker from active list
-        if worker in self.active_workers:
-            self.active_workers.remove(worker)
-        
         if success:
-            self.status_bar.showMessage("✓ Unmounted successfully")
+            self._show_status("✓ Unmounted successfully")
         else:
-            self.status_bar.showMessage(f"✗ Unmount failed")
+            self._show_status(f"✗ Unmount failed")
             
             # Show helpful dialog for unmount failures
             if "files are being accessed" in message or "busy" in message.lower():
-                self.show_unmount_help_dialog(message)
+                self.show_unmount_help_dialog(message, mount_point)
             else:
                 QMessageBox.warning(self, "Unmount Failed", f"Failed to unmount:\n{message}")
         
-        # Update widget status
-        for widget in self.bucket_widgets:
+        # Only the widget on the unmounted path changed
+        widget = self._widgets_by_mount.get(mount_point)
+        if widget is not None:
             widget.update_mount_status()
     
-    def show_unmount_help_dialog(self, error_message: str):
+    def show_unmount_help_dialog(self, error_message: str, mount_point: str):
         """Show helpful dialog for unmount issues."""
         dialog = QMessageBox(self)
         dialog.setWindowTitle("Unmount Failed - Device Busy")
@@ -3961,36 +5068,26 @@ class HaioDriveClient(QMainWindow):
         
         dialog.setText("Cannot unmount because files are being accessed.")
         
-        detailed_text = f"""Error details: {error_message}
-
-Common solutions:
-• Close any file managers or file explorers showing this location
-• Close any applications that have files open from this location  
-• Close any terminal windows with current directory in this location
-• Wait a moment and try again
-
-The system will automatically retry unmounting when files are no longer in use."""
-        
-        dialog.setDetailedText(detailed_text)
+        dialog.setDetailedText(_UNMOUNT_BUSY_DETAILS.format(error=error_message))
         dialog.setStandardButtons(QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Retry)
         dialog.setDefaultButton(QMessageBox.StandardButton.Retry)
         
         result = dialog.exec()
         if result == QMessageBox.StandardButton.Retry:
-            # Find the mount point and retry unmount
-            for widget in self.bucket_widgets:
-                if widget.is_mounted:
-                    self.unmount_bucket(widget.mount_point)
-                    break
+            # Retry the unmount that failed
+            self.unmount_bucket(mount_point)
     
+    @pyqtSlot(str, bool)
     def toggle_auto_mount(self, bucket_name: str, enabled: bool):
         """Toggle auto-mount at boot for a bucket."""
         if enabled:
             # Use appropriate mount point for the platform
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # Try to find an available drive letter for Windows
                 import string
                 used_drives = [d.upper() for d in string.ascii_uppercase if os.path.exists(f"{d}:")]
+                # Letters already promised to queued buckets count as used too
+                used_drives += [mp[0] for mp in self._pending_toggles.values() if mp and len(mp) == 2 and mp[1] == ':']
                 available_drives = [d for d in string.ascii_uppercase if d not in used_drives and d not in ['A', 'B', 'C']]
                 
                 if available_drives:
@@ -3999,34 +5096,88 @@ The system will automatically retry unmounting when files are no longer in use."
                     mount_point = f"{drive_letter}:"
                 else:
                     # Fallback to folder in user's home directory
-                    user_home = os.path.expanduser("~")
-                    mount_point = os.path.join(user_home, f"haio-{self.current_user}-{bucket_name}")
+                    mount_point = self._mount_path_for(bucket_name)
             else:
                 # Linux/Unix - use user's home directory to avoid permission issues
-                user_home = os.path.expanduser("~")
-                mount_point = os.path.join(user_home, f"haio-{self.current_user}-{bucket_name}")
-            success = self.rclone_manager.create_auto_mount_service(
-                self.current_user, bucket_name, mount_point, self)
-            
-            if success:
-                self.status_bar.showMessage(f"✓ Auto-mount enabled for {bucket_name}")
-            else:
-                self.status_bar.showMessage(f"✗ Failed to enable auto-mount for {bucket_name}")
-                platform_name = "Windows" if os.name == 'nt' else "Linux"
-                QMessageBox.warning(self, "Auto-mount Failed", 
-                                  f"Failed to enable auto-mount for {bucket_name}.\n"
-                                  f"Make sure you have admin privileges on {platform_name}.")
+                mount_point = self._mount_path_for(bucket_name)
+            self._show_status(_MSG_AUTO_ON_START.format(bucket_name))
+        else:
+            self._show_status(_MSG_AUTO_OFF_START.format(bucket_name))
+        
+        # systemctl/schtasks can take seconds; keep the checkbox locked until done
+        widget = self._widgets_by_name.get(bucket_name)
+        if widget is not None:
+            widget.auto_mount_cb.setEnabled(False)
+        
+        # Restart the debounce so a burst of clicks is dispatched together
+        self._pending_toggles[bucket_name] = mount_point if enabled else None
+        self._toggle_timer.start()
+    
+    def _flush_toggles(self):
+        """Dispatch pending auto-mount toggles: disables per bucket, enables as one batch."""
+        for bucket_name in [name for name, mount_point in self._pending_toggles.items() if mount_point is None]:
+            del self._pending_toggles[bucket_name]
+            worker = AutoMountSetupWorker(self.rclone_manager, 'disable', self.current_user, bucket_name)
+            self._track_worker(worker)
+            worker.finished.connect(functools.partial(self.on_auto_mount_disabled, bucket_name=bucket_name))
+            worker.start()
+        
+        # One daemon-reload/elevation prompt covers every bucket enabled during
+        # the debounce or while the previous batch was running
+        if self._auto_mount_batch_running or not self._pending_toggles:
+            return
+        
+        specs = list(self._pending_toggles.items())
+        self._pending_toggles.clear()
+        self._auto_mount_batch_running = True
+        worker = AutoMountBatchWorker(self.rclone_manager, self.current_user, specs)
+        self._track_worker(worker)
+        worker.finished.connect(self.on_auto_mount_enabled)
+        worker.start()
+    
+    def on_auto_mount_enabled(self, results: Dict[str, bool]):
+        """Report the result of an auto-mount enable batch."""
+        self._auto_mount_batch_running = False
+        
+        failed = [bucket_name for bucket_name, success in results.items() if not success]
+        if failed:
+            failed_names = ", ".join(failed)
+            self._show_status(_MSG_AUTO_ON_FAIL.format(failed_names))
+            # Show the modal once this slot returns, so the checkboxes are
+            # re-enabled and queued toggles flushed without waiting on the user
+            QTimer.singleShot(0, functools.partial(
+                QMessageBox.warning, self, "Auto-mount Failed", _MSG_AUTO_ON_FAIL_DETAIL.format(failed_names)))
         else:
+            self._show_status(_MSG_AUTO_ON_OK.format(", ".join(results)))
+        
+        for bucket_name in results:
+            widget = self._widgets_by_name.get(bucket_name)
+            if widget is not None:
+                widget.auto_mount_cb.setEnabled(True)
+        
+        # Buckets toggled while this batch ran go out as the next one
+        self._flush_toggles()
+        
+        # Lingering may need a password prompt, which only the GUI thread can
+        # show; like the warning above it waits until this slot has returned
+        if _IS_LINUX and any(results.values()):
+            QTimer.singleShot(0, functools.partial(self.rclone_manager._ensure_linger, self))
+    
+    def on_auto_mount_disabled(self, success: bool, message: str, bucket_name: str):
+        """Report the result of disabling auto-mount."""
+        # Legacy system-wide units need a sudo password prompt; retry here with one
+        if not success and _IS_LINUX:
             success = self.rclone_manager.remove_auto_mount_service(self.current_user, bucket_name, self)
-            
-            if success:
-                self.status_bar.showMessage(f"✓ Auto-mount disabled for {bucket_name}")
-            else:
-                self.status_bar.showMessage(f"✗ Failed to disable auto-mount for {bucket_name}")
+        
+        self._show_status((_MSG_AUTO_OFF_OK if success else _MSG_AUTO_OFF_FAIL).format(bucket_name))
+        
+        widget = self._widgets_by_name.get(bucket_name)
+        if widget is not None:
+            widget.auto_mount_cb.setEnabled(True)
     
     def scan_existing_mounts(self):
         """Scan for existing mounts and update GUI accordingly."""
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             # This is mainly for Windows drive letter detection
             return
             
@@ -4086,7 +5237,7 @@ The system will automatically retry unmounting when files are no longer in use."
         """Check if a mount point is likely an rclone mount for the given bucket."""
         try:
             # Check if there are any rclone processes running
-            result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq rclone.exe'], 
+            result = self.rclone_manager._run_hidden_subprocess(['tasklist', '/FI', 'IMAGENAME eq rclone.exe'], 
                                   capture_output=True, text=True, timeout=5)
             if result.returncode == 0 and 'rclone.exe' in result.stdout:
                 # There are rclone processes running, this could be our mount
@@ -4114,8 +5265,6 @@ The system will automatically retry unmounting when files are no longer in use."
             return
         
         try:
-            from PyQt6.QtWidgets import QMessageBox
-            
             self.status_bar.showMessage("🔍 Scanning for orphaned buckets...")
             
             # Get current buckets from API
@@ -4135,7 +5284,7 @@ The system will automatically retry unmounting when files are no longer in use."
             
             # Find all mounted buckets
             mounted_orphans = []
-            home = os.path.expanduser("~")
+            home = self._user_home
             
             for widget in self.bucket_widgets:
                 bucket_name = widget.bucket_info.get('name')
@@ -4276,7 +5425,6 @@ The system will automatically retry unmounting when files are no longer in use."
             import traceback
             traceback.print_exc()
             
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self,
                 "Cleanup Error",
@@ -4296,9 +5444,21 @@ The system will automatically retry unmounting when files are no longer in use."
         if not self.current_user:
             return
         
+        # Skip this tick if the previous sync is still waiting on the API
+        if self.stats_worker.isRunning():
+            return
+        
+        # Reload buckets data from API in the background so the periodic
+        # sync never blocks the GUI thread on the network
+        self.stats_worker.start()
+    
+    def on_bucket_stats_synced(self, buckets: List[Dict]):
+        """Apply a background bucket listing to the displayed buckets."""
+        # User may have logged out while the request was in flight
+        if not self.current_user:
+            return
+        
         try:
-            # Reload buckets data from API
-            buckets = self.api_client.list_containers()
             if buckets is None:
                 return
             
@@ -4306,7 +5466,7 @@ The system will automatically retry unmounting when files are no longer in use."
             api_bucket_names = {bucket.get('name', '') for bucket in buckets}
             
             # Get bucket names currently displayed in UI
-            ui_bucket_names = {widget.bucket_info.get('name') for widget in self.bucket_widgets}
+            ui_bucket_names = set(self._widgets_by_name)
             
             # Find deleted buckets (in UI but not in API response)
             deleted_buckets = ui_bucket_names - api_bucket_names
@@ -4348,7 +5508,6 @@ The system will automatically retry unmounting when files are no longer in use."
                             else:
                                 print(f"⚠️  Failed to remove auto-mount service for {bucket_name}")
                                 # Show warning but don't block bucket removal
-                                from PyQt6.QtWidgets import QMessageBox
                                 service_name = f"haio-{self.current_user}-{bucket_name}"
                                 QMessageBox.warning(
                                     self,
@@ -4382,14 +5541,12 @@ The system will automatically retry unmounting when files are no longer in use."
             if buckets and self.bucket_widgets:
                 print(f"📊 Updating stats for {len(self.bucket_widgets)} bucket(s) (partial update)")
                 for bucket_data in buckets:
-                    bucket_name = bucket_data.get('name', '')
-                    for widget in self.bucket_widgets:
-                        if widget.bucket_info.get('name') == bucket_name:
-                            # Update stats display only - no widget recreation
-                            objects_count = bucket_data.get('count', 0)
-                            size_bytes = bucket_data.get('bytes', 0)
-                            widget.update_stats(objects_count, size_bytes)
-                            break
+                    widget = self._widgets_by_name.get(bucket_data.get('name', ''))
+                    if widget is not None:
+                        # Update stats display only - no widget recreation
+                        objects_count = bucket_data.get('count', 0)
+                        size_bytes = bucket_data.get('bytes', 0)
+                        widget.update_stats(objects_count, size_bytes)
                 # Update status bar briefly to show sync happened
                 self.status_bar.showMessage("✓ Stats synced", 2000)
         except Exception as e:
@@ -4399,7 +5556,6 @@ The system will automatically retry unmounting when files are no longer in use."
     
     def show_tools_menu(self):
         """Show a popup menu with additional tools and actions."""
-        from PyQt6.QtWidgets import QMenu
         
         menu = QMenu(self)
         menu.setStyleSheet("""
@@ -4430,6 +5586,11 @@ The system will automatically retry unmounting when files are no longer in use."
         clear_orphaned_action.triggered.connect(self.clear_orphaned_buckets)
         clear_orphaned_action.setToolTip("Clean up mounted buckets that no longer exist")
         
+        # Offer the boot-time sudo prompt again if it was turned down before
+        if self.rclone_manager.linger_declined():
+            linger_action = menu.addAction("🔓 Start Auto-mounts at Boot")
+            linger_action.triggered.connect(lambda: self.rclone_manager.retry_linger(self))
+        
         menu.addSeparator()
         
         # About/Help action
@@ -4441,7 +5602,6 @@ The system will automatically retry unmounting when files are no longer in use."
     
     def show_about_dialog(self):
         """Show about dialog with app information."""
-        from PyQt6.QtWidgets import QMessageBox
         
         msg = QMessageBox(self)
         msg.setWindowTitle("About Haio Smart App")
@@ -4474,10 +5634,13 @@ The system will automatically retry unmounting when files are no longer in use."
         if self.stats_sync_timer.isActive():
             self.stats_sync_timer.stop()
         
-        # Unmount all buckets first
-        for widget in self.bucket_widgets:
+        # Unmount all buckets in parallel in the background; nothing below needs
+        # them gone, so the login dialog comes up without waiting on fusermount
+        for mount_point, widget in self._widgets_by_mount.items():
             if widget.is_mounted:
-                self.rclone_manager.unmount_bucket(widget.mount_point)
+                worker = MountWorker('unmount', self.rclone_manager, mount_point=mount_point)
+                self._track_worker(worker)
+                worker.start()
         
         # Clear current user data
         username_to_clear = self.current_user  # Save username before clearing
@@ -4487,25 +5650,12 @@ The system will automatically retry unmounting when files are no longer in use."
         
         # Clear bucket display
         self.buckets = []
-        self.bucket_widgets = []
         self.display_buckets()
         
         # Clear saved credentials for this user
         try:
-            token_file = os.path.join(self.token_manager.config_dir, "tokens.json")
-            if os.path.exists(token_file) and username_to_clear:
-                with open(token_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Remove the user's saved credentials
-                if username_to_clear in data:
-                    del data[username_to_clear]
-                    
-                    # Save the updated data
-                    with open(token_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-                    
-                    print(f"Cleared saved credentials for {username_to_clear}")
+            if username_to_clear and self.token_manager.remove_user(username_to_clear):
+                print(f"Cleared saved credentials for {username_to_clear}")
         except Exception as e:
             print(f"Error clearing credentials: {e}")
         
@@ -4517,20 +5667,30 @@ The system will automatically retry unmounting when files are no longer in use."
     
     def closeEvent(self, event):
         """Handle application close event."""
-        # Clean up any running workers
-        for worker in self.active_workers:
-            if worker.isRunning():
+        # Stop background workers cooperatively: ask every running worker to
+        # stop, wait for all of them against one shared deadline, and only
+        # terminate() a thread that still hasn't returned after that
+        workers = list(self.active_workers)
+        workers += [self.bucket_worker, self.stats_worker, self.dependency_worker]
+        if self._login_dialog is not None:
+            workers.append(self._login_dialog.auth_worker)
+        running = [worker for worker in workers if worker is not None and worker.isRunning()]
+        for worker in running:
+            # The window is going away: don't let a late finished signal reach
+            # its slots (dialogs, widget updates) mid-teardown
+            with contextlib.suppress(TypeError):
+                worker.finished.disconnect()
+            worker.requestInterruption()
+        deadline = time.monotonic() + 3.0
+        for worker in running:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not worker.wait(remaining_ms):
+                print(f"Worker {type(worker).__name__} did not stop in time; terminating")
                 worker.terminate()
-                worker.wait(3000)  # Wait up to 3 seconds
-        
-        # Clean up auth and bucket workers if they exist
-        if hasattr(self, 'auth_worker') and self.auth_worker.isRunning():
-            self.auth_worker.terminate()
-            self.auth_worker.wait(3000)
+                worker.wait(1000)
         
-        if hasattr(self, 'bucket_worker') and self.bucket_worker.isRunning():
-            self.bucket_worker.terminate()
-            self.bucket_worker.wait(3000)
+        # Release pooled HTTP connections
+        self.api_client.close()
         
         event.accept()
         
@@ -4573,7 +5733,7 @@ def main():
 
             mgr = RcloneManager()
             # Set default log file if provided or use a sensible default for auto-mount
-            log_file = args.log_file or os.path.join(os.path.expanduser('~/.config/haio-client'), f"rclone-{bucket}.log")
+            log_file = args.log_file or os.path.join(_APP_CONFIG_DIR, f"rclone-{bucket}.log")
             try:
                 os.makedirs(os.path.dirname(log_file), exist_ok=True)
                 mgr.rclone_log_file = log_file
@@ -4582,7 +5742,7 @@ def main():
             mgr.setup_rclone_config(username, pwd)
 
             # Ensure WinFsp on Windows
-            if platform.system() == 'Windows' and not mgr._check_winfsp_installation():
+            if _IS_WINDOWS and not mgr._check_winfsp_installation():
                 print("WinFsp missing; cannot auto-mount")
                 return 5
 
@@ -4595,6 +5755,9 @@ def main():
             return 1
 
     # Normal GUI mode
+    # DPI/GL attributes only take effect before the QApplication exists
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
     app = QApplication(sys.argv)
     app.setApplicationName("Haio Smart Solutions Client")
     app.setApplicationVersion("1.5.2")